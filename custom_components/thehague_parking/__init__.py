@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable
-from dataclasses import dataclass, field
-from datetime import datetime, time, timedelta
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from functools import partial
 import logging
 from pathlib import Path
 
@@ -17,32 +18,47 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_create_clientsession
-from homeassistant.helpers.event import async_track_time_change
+from homeassistant.helpers.event import (
+    async_track_point_in_time,
+    async_track_time_change,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 
-from .api import TheHagueParkingClient, TheHagueParkingCredentials
+from .api import (
+    TheHagueParkingClient,
+    TheHagueParkingCredentials,
+    TheHagueParkingError,
+    format_datetime,
+)
 from .const import (
     CONF_AUTO_END_ENABLED,
+    CONF_END_AT_SCHEDULE,
     CONF_SCHEDULE,
     CONF_WORKDAYS,
     CONF_WORKING_FROM,
     CONF_WORKING_TO,
+    DATA_PENDING_SESSIONS,
     DOMAIN,
 )
-from .coordinator import TheHagueParkingCoordinator
-from .schedule import (
-    end_times as schedule_end_times,
-    is_overnight,
-    schedule_for_options,
-)
+from .coordinator import TheHagueParkingCoordinator, TheHagueParkingResource
+from .schedule import CompiledSchedule, schedule_for_options
 from .services import async_register_services
-from .storage import CreatedReservationsStore
+from .storage import (
+    CreatedReservationsStore,
+    SessionStore,
+    SnapshotStore,
+    ZoneHoursStore,
+)
+from .zone_hours import ZoneHours, async_build_zone_hours
 
 PLATFORMS: tuple[str, ...] = ("sensor",)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Retry a failed auto-end delete after this delay.
+_AUTO_END_RETRY_DELAY = timedelta(minutes=1)
+
 
 @dataclass(slots=True)
 class TheHagueParkingRuntimeData:
@@ -51,11 +67,20 @@ class TheHagueParkingRuntimeData:
     session: ClientSession
     coordinator: TheHagueParkingCoordinator
     created_reservations_store: CreatedReservationsStore
+    session_store: SessionStore
+    zone_hours_store: ZoneHoursStore
+    zone_hours: ZoneHours | None = None
     created_reservation_ids: set[int] = field(default_factory=set)
     created_reservations_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     prune_task: asyncio.Task[None] | None = None
-    auto_end_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
-    auto_end_unsubs: list[Callable[[], None]] = field(default_factory=list)
+    # Reservation id -> (end instant, unsub) of the armed auto-end timers.
+    auto_end_timers: dict[int, tuple[datetime, Callable[[], None]]] = field(
+        default_factory=dict
+    )
+    # Reservation ids whose auto-end delete is in flight.
+    ending_reservation_ids: set[int] = field(default_factory=set)
+    # Reservation ids whose end time is being (or could not be) rewritten.
+    end_time_rewrite_ids: set[int] = field(default_factory=set)
     update_listener_unsub: Callable[[], None] | None = None
 
 
@@ -107,185 +132,242 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 def _zone_hhmm(entry: TheHagueParkingConfigEntry) -> tuple[str | None, str | None]:
     """Return zone start/end time (local) as HH:MM if available."""
-    account = entry.runtime_data.coordinator.data.account
-    zone = account.get("zone") if isinstance(account, dict) else None
-    if not isinstance(zone, dict):
+    if (zone_hours := entry.runtime_data.zone_hours) is not None:
+        zone_from, zone_to = zone_hours.hhmm(dt_util.now().weekday())
+        if zone_from is not None and zone_to is not None:
+            return zone_from, zone_to
+
+    if (zone := entry.runtime_data.coordinator.data.account.zone) is None:
         return None, None
 
-    def _to_hhmm(value: object) -> str | None:
-        if not isinstance(value, str):
-            return None
-        parsed = dt_util.parse_datetime(value)
-        if parsed is None:
+    def _to_hhmm(value: datetime | None) -> str | None:
+        if value is None:
             return None
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-        local = dt_util.as_local(parsed)
+        local = dt_util.as_local(value)
         return f"{local.hour:02d}:{local.minute:02d}"
 
-    return _to_hhmm(zone.get("start_time")), _to_hhmm(zone.get("end_time"))
-
-
-def _reservation_id(value: object) -> int | None:
-    """Parse reservation id to int."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str) and value.isdigit():
-        return int(value)
-    return None
-
-
-def _reservation_start_utc(value: object) -> datetime | None:
-    """Parse reservation start time to UTC datetime."""
-    if not isinstance(value, str):
-        return None
-    if not (parsed := dt_util.parse_datetime(value)):
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-    return dt_util.as_utc(parsed)
-
-
-def _last_scheduled_end_utc(
-    now: datetime, schedule: dict[int, tuple[bool, time, time]]
-) -> datetime | None:
-    """Return the most recent schedule end time (UTC) that is <= now."""
-    now_local = dt_util.as_local(now)
-    candidates: list[datetime] = []
-    for days_back in range(8):
-        day_date = now_local.date() - timedelta(days=days_back)
-        weekday = day_date.weekday()
-        enabled, from_time, to_time = schedule[weekday]
-        if not enabled:
-            continue
+    return _to_hhmm(zone.start_time), _to_hhmm(zone.end_time)
+
+
+async def _async_end_created_reservation(
+    hass: HomeAssistant,
+    entry: TheHagueParkingConfigEntry,
+    reservation_id: int,
+    target: datetime,
+) -> None:
+    runtime_data = entry.runtime_data
+    runtime_data.auto_end_timers.pop(reservation_id, None)
+    # Keep the timer sync away from this reservation until the delete finished.
+    runtime_data.ending_reservation_ids.add(reservation_id)
+    coordinator = runtime_data.coordinator
+
+    try:
+        await coordinator.client.async_delete_reservation(reservation_id)
+    except TheHagueParkingError as err:
+        _LOGGER.warning(
+            "Failed to end reservation %s, retrying in %s",
+            reservation_id,
+            _AUTO_END_RETRY_DELAY,
+            exc_info=err,
+        )
+        _async_arm_auto_end_timer(
+            hass, entry, reservation_id, target, dt_util.utcnow() + _AUTO_END_RETRY_DELAY
+        )
+        return
+    finally:
+        runtime_data.ending_reservation_ids.discard(reservation_id)
+
+    _LOGGER.info("Ended reservation %s", reservation_id)
+    async with runtime_data.created_reservations_lock:
+        runtime_data.created_reservation_ids.discard(reservation_id)
+        await runtime_data.created_reservations_store.async_save(
+            runtime_data.created_reservation_ids
+        )
+    coordinator.async_remove_reservations((reservation_id,))
+
+
+@callback
+def _async_arm_auto_end_timer(
+    hass: HomeAssistant,
+    entry: TheHagueParkingConfigEntry,
+    reservation_id: int,
+    target: datetime,
+    when: datetime,
+) -> None:
+    """Arm the timer ending a reservation for its schedule end (target) at when."""
 
-        end_date = day_date if not is_overnight(from_time, to_time) else day_date + timedelta(days=1)
-        end_local = datetime.combine(
-            end_date,
-            to_time,
-            tzinfo=dt_util.DEFAULT_TIME_ZONE,
-        ).replace(second=0, microsecond=0)
-        end_utc = dt_util.as_utc(end_local)
-        if end_utc <= now:
-            candidates.append(end_utc)
+    async def _async_handle(_now: datetime) -> None:
+        await _async_end_created_reservation(hass, entry, reservation_id, target)
 
-    return max(candidates) if candidates else None
+    entry.runtime_data.auto_end_timers[reservation_id] = (
+        target,
+        async_track_point_in_time(hass, _async_handle, when),
+    )
 
 
-async def _async_end_active_reservations(
-    entry: TheHagueParkingConfigEntry, *, started_before: datetime | None = None
+async def _async_rewrite_end_times(
+    entry: TheHagueParkingConfigEntry, targets: dict[int, datetime]
 ) -> None:
+    """Patch created reservations to end at their schedule end.
+
+    The delete timers stay armed as a fallback until the patched reservations
+    come back with the new end time. Reservations the API refuses to patch are
+    not tried again and are ended by their timer.
+    """
     runtime_data = entry.runtime_data
-    async with runtime_data.auto_end_lock:
-        coordinator = runtime_data.coordinator
-        client = coordinator.client
+    coordinator = runtime_data.coordinator
+    try:
+        results = await coordinator.client.async_patch_reservation_end_times(
+            {
+                reservation_id: format_datetime(target)
+                for reservation_id, target in targets.items()
+            }
+        )
+    except TheHagueParkingError as err:
+        _LOGGER.warning("Failed to set reservation end times: %s", err)
+        runtime_data.end_time_rewrite_ids.difference_update(targets)
+        return
 
-        await coordinator.async_request_refresh()
-        async with runtime_data.created_reservations_lock:
-            created_ids = set(runtime_data.created_reservation_ids)
+    for result in results:
+        if result.error is not None:
+            _LOGGER.warning(
+                "Failed to set the end time of reservation %s: %s",
+                result.item,
+                result.error,
+            )
+            continue
+        runtime_data.end_time_rewrite_ids.discard(result.item)
+        if result.result is not None:
+            coordinator.async_upsert_reservation(result.result)
+        elif (
+            reservation := coordinator.data.reservations_by_id.get(result.item)
+        ) is not None:
+            coordinator.async_upsert_reservation(
+                replace(reservation, end_time=targets[result.item])
+            )
 
-        if not created_ids:
-            return
 
-        reservation_ids: list[int] = []
-        for reservation in coordinator.data.reservations:
-            if not (reservation_id := _reservation_id(reservation.get("id"))):
+@callback
+def _async_sync_auto_end_timers(
+    hass: HomeAssistant, entry: TheHagueParkingConfigEntry
+) -> None:
+    """Arm one timer per created reservation at its schedule end.
+
+    A reservation whose own end time comes first is ended by the backend and
+    needs no timer. Schedule ends that already passed (e.g. while Home
+    Assistant was stopped) fire right away.
+    """
+    runtime_data = entry.runtime_data
+    coordinator = runtime_data.coordinator
+    timers = runtime_data.auto_end_timers
+    data = coordinator.data
+    if data.stale:
+        return
+
+    # Ids the API refused to patch stay in the set while the reservation lives,
+    # so the rewrite is not retried on every update; forget them once it ended.
+    runtime_data.end_time_rewrite_ids.intersection_update(data.reservations_by_id)
+
+    targets: dict[int, datetime] = {}
+    if (schedule := coordinator.schedule) is not None:
+        now = dt_util.utcnow()
+        for reservation_id in runtime_data.created_reservation_ids & data.reservations_by_id.keys():
+            reservation = data.reservations_by_id[reservation_id]
+            if (
+                schedule_end := next(
+                    schedule.iter_ends_after(reservation.start_time or now), None
+                )
+            ) is None:
                 continue
-            if reservation_id not in created_ids:
+            if reservation.end_time is not None and reservation.end_time <= schedule_end:
                 continue
-            if started_before is not None:
-                start_utc = _reservation_start_utc(reservation.get("start_time"))
-                if start_utc is None or start_utc > started_before:
-                    continue
-            reservation_ids.append(reservation_id)
+            targets[reservation_id] = schedule_end
+
+    if targets and coordinator.config_entry.options.get(CONF_END_AT_SCHEDULE, False):
+        now = dt_util.utcnow()
+        if rewrites := {
+            reservation_id: target
+            for reservation_id, target in targets.items()
+            if target > now and reservation_id not in runtime_data.end_time_rewrite_ids
+        }:
+            runtime_data.end_time_rewrite_ids.update(rewrites)
+            entry.async_create_background_task(
+                hass,
+                _async_rewrite_end_times(entry, rewrites),
+                f"{DOMAIN} rewrite end times",
+            )
 
-        if not reservation_ids:
-            return
+    for reservation_id in list(timers):
+        if targets.get(reservation_id) != timers[reservation_id][0]:
+            timers.pop(reservation_id)[1]()
 
-        try:
-            await client.async_login()
-        except Exception:  # allowed in background task
-            _LOGGER.exception("Failed to log in before ending reservations")
-            return
+    for reservation_id, target in targets.items():
+        if (
+            reservation_id not in timers
+            and reservation_id not in runtime_data.ending_reservation_ids
+        ):
+            _async_arm_auto_end_timer(hass, entry, reservation_id, target, target)
 
-        results = await asyncio.gather(
-            *(client.async_delete_reservation(reservation_id) for reservation_id in reservation_ids),
-            return_exceptions=True,
-        )
-        ended = 0
-        ended_ids: list[int] = []
-        for reservation_id, result in zip(reservation_ids, results, strict=True):
-            if isinstance(result, BaseException):
-                _LOGGER.error(
-                    "Failed to end reservation %s", reservation_id, exc_info=result
-                )
-            else:
-                ended += 1
-                ended_ids.append(reservation_id)
 
-        if ended:
-            _LOGGER.info("Ended %s active reservation(s)", ended)
-            async with runtime_data.created_reservations_lock:
-                runtime_data.created_reservation_ids.difference_update(ended_ids)
-                await runtime_data.created_reservations_store.async_save(
-                    runtime_data.created_reservation_ids
-                )
-            await coordinator.async_request_refresh()
+@callback
+def _async_cancel_auto_end_timers(entry: TheHagueParkingConfigEntry) -> None:
+    timers = entry.runtime_data.auto_end_timers
+    for _target, unsub in timers.values():
+        unsub()
+    timers.clear()
 
 
 def _async_setup_auto_end(hass: HomeAssistant, entry: TheHagueParkingConfigEntry) -> None:
     runtime_data = entry.runtime_data
-    for unsub in runtime_data.auto_end_unsubs:
-        unsub()
-    runtime_data.auto_end_unsubs.clear()
+    _async_cancel_auto_end_timers(entry)
 
     options = entry.options
-    if not bool(options.get(CONF_AUTO_END_ENABLED, True)):
-        return
+    runtime_data.coordinator.schedule = None
+    if bool(options.get(CONF_AUTO_END_ENABLED, True)):
+        zone_from, zone_to = _zone_hhmm(entry)
+        runtime_data.coordinator.schedule = CompiledSchedule.from_options(
+            options, fallback_from=zone_from, fallback_to=zone_to
+        )
+    _async_sync_auto_end_timers(hass, entry)
 
-    zone_from, zone_to = _zone_hhmm(entry)
-    schedule = schedule_for_options(options, fallback_from=zone_from, fallback_to=zone_to)
-    if not (end_time_set := schedule_end_times(schedule)):
-        return
 
-    async def _async_handle(now: datetime) -> None:
-        now_local = dt_util.as_local(now)
-        now_time = now_local.time().replace(second=0, microsecond=0)
-        weekday = now_local.weekday()
-        prev = (weekday - 1) % 7
+async def _async_refresh_zone_hours(
+    hass: HomeAssistant, entry: TheHagueParkingConfigEntry
+) -> None:
+    """Rebuild and store the weekly zone hours table."""
+    runtime_data = entry.runtime_data
+    try:
+        zone_hours = await async_build_zone_hours(
+            runtime_data.coordinator.client, dt_util.utcnow()
+        )
+    except TheHagueParkingError as err:
+        _LOGGER.debug("Could not refresh zone hours: %s", err)
+        return
 
-        enabled_today, from_today, to_today = schedule[weekday]
-        enabled_prev, from_prev, to_prev = schedule[prev]
+    runtime_data.zone_hours = zone_hours
+    await runtime_data.zone_hours_store.async_save(zone_hours)
 
-        should_end = False
-        if (
-            enabled_today
-            and not is_overnight(from_today, to_today)
-            and now_time == to_today
-        ):
-            should_end = True
-        if enabled_prev and is_overnight(from_prev, to_prev) and now_time == to_prev:
-            should_end = True
 
-        if should_end:
-            await _async_end_active_reservations(entry)
+def _async_setup_zone_hours(
+    hass: HomeAssistant, entry: TheHagueParkingConfigEntry
+) -> None:
+    """Keep the weekly zone hours table up to date."""
 
-    for end_hour, end_minute in end_time_set:
-        runtime_data.auto_end_unsubs.append(
-            async_track_time_change(
-                hass,
-                _async_handle,
-                hour=end_hour,
-                minute=end_minute,
-                second=0,
-            )
+    @callback
+    def _async_schedule_refresh(_now: datetime | None = None) -> None:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_zone_hours(hass, entry),
+            f"{DOMAIN} zone hours refresh",
         )
 
-    now = dt_util.now()
-    if (last_end := _last_scheduled_end_utc(now, schedule)) is not None:
-        hass.async_create_task(
-            _async_end_active_reservations(entry, started_before=last_end)
+    if (zone_hours := entry.runtime_data.zone_hours) is None or zone_hours.stale:
+        _async_schedule_refresh()
+    entry.async_on_unload(
+        async_track_time_change(
+            hass, _async_schedule_refresh, hour=3, minute=30, second=0
         )
+    )
 
 
 async def async_setup(hass: HomeAssistant, _config: ConfigType) -> bool:
@@ -318,35 +400,57 @@ async def async_setup_entry(
         cookie_jar=CookieJar(),
     )
 
+    session_store = SessionStore(hass, entry.entry_id)
     client = TheHagueParkingClient(
         session=session,
         credentials=TheHagueParkingCredentials(
             username=entry.data[CONF_USERNAME],
             password=entry.data[CONF_PASSWORD],
         ),
+        on_login=lambda: session_store.async_delay_save(client.export_session),
     )
+    # Prefer the session the config flow just created; otherwise reuse the one
+    # from the previous run. Either is replaced on the first rejected request.
+    if (
+        session_data := hass.data.get(DATA_PENDING_SESSIONS, {}).pop(
+            entry.unique_id, None
+        )
+    ) is not None:
+        session_store.async_delay_save(lambda: session_data)
+    else:
+        session_data = await session_store.async_load()
+    if session_data is not None and client.restore_session(session_data):
+        _LOGGER.debug("Reusing stored session")
 
     coordinator = TheHagueParkingCoordinator(hass, client=client, config_entry=entry)
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except Exception:
-        await session.close()
-        raise
+    snapshot_store = SnapshotStore(hass, entry.entry_id)
+    # Start from the last confirmed data when there is any; the live refresh
+    # then runs in the background instead of delaying startup.
+    if (snapshot := await snapshot_store.async_load()) is not None:
+        coordinator.async_restore_snapshot(*snapshot)
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            client.close()
+            await session.close()
+            raise
 
+    zone_hours_store = ZoneHoursStore(hass, entry.entry_id)
     created_reservations_store = CreatedReservationsStore(hass, entry.entry_id)
     created_reservation_ids = await created_reservations_store.async_load()
-    active_ids = {
-        reservation_id
-        for reservation in coordinator.data.reservations
-        if (reservation_id := _reservation_id(reservation.get("id")))
-    }
-    created_reservation_ids.intersection_update(active_ids)
-    await created_reservations_store.async_save(created_reservation_ids)
+    # Stale reservations are pruned by the listener once the API confirmed them.
+    if not coordinator.data.stale:
+        created_reservation_ids.intersection_update(coordinator.data.reservations_by_id)
+        await created_reservations_store.async_save(created_reservation_ids)
 
     runtime_data = TheHagueParkingRuntimeData(
         session=session,
         coordinator=coordinator,
         created_reservations_store=created_reservations_store,
+        session_store=session_store,
+        zone_hours_store=zone_hours_store,
+        zone_hours=await zone_hours_store.async_load(),
         created_reservation_ids=created_reservation_ids,
     )
     entry.runtime_data = runtime_data
@@ -361,11 +465,9 @@ async def async_setup_entry(
 
         async def _async_prune() -> None:
             await asyncio.sleep(1)
-            active_ids = {
-                reservation_id
-                for reservation in runtime_data.coordinator.data.reservations
-                if (reservation_id := _reservation_id(reservation.get("id")))
-            }
+            if runtime_data.coordinator.data.stale:
+                return
+            active_ids = runtime_data.coordinator.data.reservations_by_id.keys()
             async with runtime_data.created_reservations_lock:
                 if runtime_data.created_reservation_ids.issubset(active_ids):
                     return
@@ -381,9 +483,35 @@ async def async_setup_entry(
 
         runtime_data.prune_task.add_done_callback(_async_clear_prune_task)
 
-    entry.async_on_unload(coordinator.async_add_listener(_async_prune_created_reservations))
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            _async_prune_created_reservations, TheHagueParkingResource.RESERVATIONS
+        )
+    )
+    entry.async_on_unload(
+        coordinator.async_add_listener(
+            partial(_async_sync_auto_end_timers, hass, entry),
+            TheHagueParkingResource.RESERVATIONS,
+        )
+    )
+
+    @callback
+    def _async_save_snapshot() -> None:
+        if (
+            data := coordinator.data
+        ) is not None and not data.stale and coordinator.data_updated:
+            snapshot_store.async_delay_save(data, coordinator.data_updated)
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_save_snapshot))
+    if coordinator.data.stale:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} initial refresh"
+        )
+    else:
+        _async_save_snapshot()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    _async_setup_zone_hours(hass, entry)
     _async_setup_auto_end(hass, entry)
     return True
 
@@ -402,10 +530,22 @@ async def async_unload_entry(
         hass.data[DOMAIN].pop(entry.entry_id, None)
         if entry.runtime_data.update_listener_unsub:
             entry.runtime_data.update_listener_unsub()
-        for unsub in entry.runtime_data.auto_end_unsubs:
-            unsub()
+        _async_cancel_auto_end_timers(entry)
         if (prune_task := entry.runtime_data.prune_task) and not prune_task.done():
             prune_task.cancel()
+        entry.runtime_data.coordinator.client.close()
         await entry.runtime_data.session.close()
 
     return unload_ok
+
+
+async def async_remove_entry(
+    hass: HomeAssistant, entry: TheHagueParkingConfigEntry
+) -> None:
+    """Remove the stored session and data of a deleted config entry."""
+    await asyncio.gather(
+        SessionStore(hass, entry.entry_id).async_remove(),
+        SnapshotStore(hass, entry.entry_id).async_remove(),
+        ZoneHoursStore(hass, entry.entry_id).async_remove(),
+        CreatedReservationsStore(hass, entry.entry_id).async_remove(),
+    )
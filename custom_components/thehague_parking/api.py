@@ -2,17 +2,44 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 from dataclasses import dataclass
-import json
+from datetime import UTC, date, datetime
+from email.utils import parsedate_to_datetime
+from enum import StrEnum
+from functools import partial
+from itertools import chain
 import logging
+import random
+import time
 from typing import Any
 
 import aiohttp
+from aiohttp import hdrs
+from yarl import URL
+
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import API_BASE_URL
 
 _LOGGER = logging.getLogger(__name__)
 
+# Renew the session this many seconds before it is predicted to expire.
+_SESSION_RENEW_MARGIN = 60
+FAVORITES_PAGE_SIZE = 100
+# Upper bound on favorites pages, guarding against an API that ignores the offset.
+_FAVORITES_MAX_PAGES = 50
+# Only the polled endpoints are revalidated with conditional GETs; every other
+# path (e.g. one per end-time moment) would grow the cache without bound.
+_CONDITIONAL_CACHE_PATHS = frozenset({"/api/account/0", "/api/reservation", "/api/favorite"})
+_END_TIME_CACHE_SIZE = 32
+_END_TIME_CACHE_TTL = 6 * 60 * 60
+# Lifetimes shorter than this are treated as a server-side revocation rather
+# than the regular session lifetime.
+_MIN_SESSION_LIFETIME = 120
+
 
 class TheHagueParkingError(Exception):
     """Base exception for the Den Haag parking integration."""
@@ -36,6 +63,94 @@ class TheHagueParkingConnectionError(TheHagueParkingError):
     """Raised when the API cannot be reached."""
 
 
+class TheHagueParkingCircuitOpenError(TheHagueParkingConnectionError):
+    """Raised without contacting the API while the circuit breaker is open."""
+
+
+class CircuitState(StrEnum):
+    """State of the API circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingRetryPolicy:
+    """Retry policy for transient failures of idempotent requests."""
+
+    attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 10.0
+    # Fraction of each delay that is randomised to spread out retries.
+    jitter: float = 0.5
+    methods: frozenset[str] = frozenset({"GET"})
+
+    def delay(self, attempt: int) -> float:
+        """Return the backoff delay before retry `attempt` (0-based)."""
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return delay * (1 - self.jitter * random.random())
+
+
+class _CircuitBreaker:
+    """Fail fast while the API is down and probe for recovery."""
+
+    def __init__(self, *, failure_threshold: int, recovery_timeout: float) -> None:
+        """Initialize the circuit breaker."""
+        self._failure_threshold = failure_threshold
+        self._recovery_timeout = recovery_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Return the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self._recovery_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_request(self) -> None:
+        """Raise when a request may not be sent right now."""
+        match self.state:
+            case CircuitState.OPEN:
+                raise TheHagueParkingCircuitOpenError
+            case CircuitState.HALF_OPEN:
+                # Let a single probe through; everyone else keeps failing fast.
+                if self._probing:
+                    raise TheHagueParkingCircuitOpenError
+                self._probing = True
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API."""
+        if self._opened_at is not None:
+            _LOGGER.info("The service is reachable again, closing circuit breaker")
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a request that failed because the API is unavailable."""
+        self._failures += 1
+        if self._probing or (
+            self._opened_at is None and self._failures >= self._failure_threshold
+        ):
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "The service failed %s times, pausing requests for %s seconds",
+                    self._failures,
+                    self._recovery_timeout,
+                )
+            self._opened_at = time.monotonic()
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Allow a new probe after the current one was cancelled."""
+        self._probing = False
+
+
 @dataclass(slots=True)
 class TheHagueParkingCredentials:
     """Credentials for basic authentication."""
@@ -44,6 +159,314 @@ class TheHagueParkingCredentials:
     password: str
 
 
+@dataclass(slots=True)
+class TheHagueParkingClientStats:
+    """Counters describing how the client talks to the API."""
+
+    requests: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    cache_bytes_saved: int = 0
+    coalesced_requests: int = 0
+    logins: int = 0
+    shared_logins: int = 0
+    session_renewals: int = 0
+    retries: int = 0
+    short_circuited: int = 0
+    end_time_cache_hits: int = 0
+    end_time_cache_misses: int = 0
+
+
+@dataclass(slots=True)
+class _CachedResponse:
+    """Validators and parsed body of a cacheable GET response."""
+
+    etag: str | None
+    last_modified: str | None
+    size: int
+    body: Any
+
+
+def _parse_id(value: object) -> int | None:
+    """Parse an API id to a positive int."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value if value > 0 else None
+    if isinstance(value, str) and value.isdigit():
+        return int(value) or None
+    return None
+
+
+def _parse_str(value: object) -> str | None:
+    """Return value when it is a string."""
+    return value if isinstance(value, str) else None
+
+
+def _parse_datetime(value: object) -> datetime | None:
+    """Parse an API timestamp to an aware UTC datetime."""
+    if not isinstance(value, str) or not (parsed := dt_util.parse_datetime(value)):
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return dt_util.as_utc(parsed)
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a datetime the way the API expects it."""
+    return dt_util.as_utc(value).isoformat().replace("+00:00", "Z")
+
+
+def _format_optional_datetime(value: datetime | None) -> str | None:
+    return format_datetime(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingZone:
+    """Parking zone with its start/end time for a given day."""
+
+    name: str | None
+    start_time: datetime | None
+    end_time: datetime | None
+
+    @classmethod
+    def from_dict(cls, data: object) -> TheHagueParkingZone | None:
+        """Build a zone from an API payload."""
+        if not isinstance(data, Mapping):
+            return None
+        return cls(
+            name=_parse_str(data.get("name")),
+            start_time=_parse_datetime(data.get("start_time")),
+            end_time=_parse_datetime(data.get("end_time")),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the zone as an API-style payload."""
+        return {
+            "name": self.name,
+            "start_time": _format_optional_datetime(self.start_time),
+            "end_time": _format_optional_datetime(self.end_time),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingAccount:
+    """Account with its debit minutes and zone."""
+
+    id: str | None
+    debit_minutes: int | None
+    zone: TheHagueParkingZone | None
+
+    @classmethod
+    def from_dict(cls, data: object) -> TheHagueParkingAccount:
+        """Build an account from an API payload."""
+        if not isinstance(data, Mapping):
+            return cls(id=None, debit_minutes=None, zone=None)
+
+        account_id: str | None = None
+        match data.get("id"):
+            case bool():
+                pass
+            case int() as raw_id:
+                account_id = str(raw_id)
+            case str() as raw_id if (raw_id := raw_id.strip()) and raw_id.casefold() != "none":
+                account_id = raw_id
+
+        try:
+            debit_minutes: int | None = int(data["debit_minutes"])
+        except (KeyError, TypeError, ValueError):
+            debit_minutes = None
+
+        return cls(
+            id=account_id,
+            debit_minutes=debit_minutes,
+            zone=TheHagueParkingZone.from_dict(data.get("zone")),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the account as an API-style payload."""
+        return {
+            "id": self.id,
+            "debit_minutes": self.debit_minutes,
+            "zone": self.zone.as_dict() if self.zone else None,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingReservation:
+    """Visitor parking reservation."""
+
+    id: int
+    name: str | None
+    license_plate: str | None
+    start_time: datetime | None
+    end_time: datetime | None
+
+    @classmethod
+    def from_dict(cls, data: object) -> TheHagueParkingReservation | None:
+        """Build a reservation from an API payload."""
+        if not isinstance(data, Mapping) or not (
+            reservation_id := _parse_id(data.get("id"))
+        ):
+            return None
+        return cls(
+            id=reservation_id,
+            name=_parse_str(data.get("name")),
+            license_plate=_parse_str(data.get("license_plate")),
+            start_time=_parse_datetime(data.get("start_time")),
+            end_time=_parse_datetime(data.get("end_time")),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the reservation as an API-style payload."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "license_plate": self.license_plate,
+            "start_time": _format_optional_datetime(self.start_time),
+            "end_time": _format_optional_datetime(self.end_time),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingFavorite:
+    """Favorite license plate."""
+
+    id: int
+    name: str | None
+    license_plate: str | None
+
+    @classmethod
+    def from_dict(cls, data: object) -> TheHagueParkingFavorite | None:
+        """Build a favorite from an API payload."""
+        if not isinstance(data, Mapping) or not (
+            favorite_id := _parse_id(data.get("id"))
+        ):
+            return None
+        return cls(
+            id=favorite_id,
+            name=_parse_str(data.get("name")),
+            license_plate=_parse_str(data.get("license_plate")),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the favorite as an API-style payload."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "license_plate": self.license_plate,
+        }
+
+
+def parse_reservations(data: object) -> tuple[TheHagueParkingReservation, ...]:
+    """Parse a list of reservations, skipping invalid entries."""
+    if not isinstance(data, list):
+        return ()
+    return tuple(
+        reservation
+        for item in data
+        if (reservation := TheHagueParkingReservation.from_dict(item)) is not None
+    )
+
+
+def parse_favorites(data: object) -> tuple[TheHagueParkingFavorite, ...]:
+    """Parse a list of favorites, skipping invalid entries."""
+    if not isinstance(data, list):
+        return ()
+    return tuple(
+        favorite
+        for item in data
+        if (favorite := TheHagueParkingFavorite.from_dict(item)) is not None
+    )
+
+
+def _parse_favorites_page(
+    data: object,
+) -> tuple[int, tuple[TheHagueParkingFavorite, ...]]:
+    """Parse a favorites page into (raw item count, favorites)."""
+    return (len(data) if isinstance(data, list) else 0), parse_favorites(data)
+
+
+def _parse_zone(data: object) -> TheHagueParkingZone:
+    """Parse a zone, returning an empty zone for invalid payloads."""
+    return TheHagueParkingZone.from_dict(data) or TheHagueParkingZone(
+        name=None, start_time=None, end_time=None
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingNewReservation:
+    """A reservation to create."""
+
+    license_plate: str
+    name: str | None
+    start_time: str
+    end_time: str
+
+
+@dataclass(frozen=True, slots=True)
+class TheHagueParkingBatchResult[ItemT, ResultT]:
+    """Outcome of a single item of a batch operation."""
+
+    item: ItemT
+    result: ResultT | None = None
+    error: TheHagueParkingError | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the item succeeded."""
+        return self.error is None
+
+
+type _RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _request_key(path: str, headers: dict[str, str] | None) -> _RequestKey:
+    """Return a hashable key identifying a GET request."""
+    return path, tuple(sorted(headers.items())) if headers else ()
+
+
+class _EndTimeCache:
+    """LRU cache of zone times keyed by zone and the local day they describe.
+
+    The API may answer with another day's window (e.g. tomorrow's after today's
+    zone end), so entries are keyed by the local date of the reply's start time
+    and only used for moments on that day before its zone end.
+    """
+
+    def __init__(self, *, max_size: int, ttl: float) -> None:
+        """Initialize the cache."""
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[
+            tuple[str | None, date], tuple[float, TheHagueParkingZone]
+        ] = OrderedDict()
+
+    def get(self, zone_name: str | None, moment: datetime) -> TheHagueParkingZone | None:
+        """Return the cached zone times for a moment."""
+        key = (zone_name, dt_util.as_local(moment).date())
+        if (entry := self._entries.get(key)) is None:
+            return None
+        stored_at, zone = entry
+        if time.monotonic() - stored_at > self._ttl:
+            del self._entries[key]
+            return None
+        if zone.end_time is None or moment >= zone.end_time:
+            return None
+        self._entries.move_to_end(key)
+        return zone
+
+    def put(self, zone_name: str | None, zone: TheHagueParkingZone) -> None:
+        """Store the zone times of the day the reply describes."""
+        if zone.start_time is None or zone.end_time is None:
+            return
+        key = (zone_name, dt_util.as_local(zone.start_time).date())
+        self._entries[key] = (time.monotonic(), zone)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+
 class TheHagueParkingClient:
     """Client for parkerendenhaag.denhaag.nl."""
 
@@ -54,46 +477,300 @@ class TheHagueParkingClient:
         credentials: TheHagueParkingCredentials,
         base_url: str = API_BASE_URL,
         timeout: float = 20,
+        retry_policy: TheHagueParkingRetryPolicy | None = None,
+        circuit_failure_threshold: int = 5,
+        circuit_recovery_timeout: float = 300,
+        batch_concurrency: int = 4,
+        on_login: Callable[[], None] | None = None,
     ) -> None:
         """Initialize the client."""
         self._session = session
         self._credentials = credentials
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
+        self._on_login = on_login
+        self._retry_policy = retry_policy or TheHagueParkingRetryPolicy()
+        self._batch_concurrency = max(batch_concurrency, 1)
+        self._circuit_breaker = _CircuitBreaker(
+            failure_threshold=circuit_failure_threshold,
+            recovery_timeout=circuit_recovery_timeout,
+        )
         self._login_lock = asyncio.Lock()
         self._logged_in = False
+        # Incremented on every successful login so callers that got a 401 can
+        # tell whether another caller already replaced their session.
+        self._login_generation = 0
+        self._login_time: float | None = None
+        self._session_lifetime: float | None = None
+        self._renew_handle: asyncio.TimerHandle | None = None
+        self._renew_task: asyncio.Task[None] | None = None
+        self._response_cache: dict[_RequestKey, _CachedResponse] = {}
+        self._inflight: dict[_RequestKey, asyncio.Task[Any]] = {}
+        self._zone_name: str | None = None
+        self._end_time_cache = _EndTimeCache(
+            max_size=_END_TIME_CACHE_SIZE, ttl=_END_TIME_CACHE_TTL
+        )
+        self.stats = TheHagueParkingClientStats()
 
     async def async_login(self, *, force: bool = False) -> None:
         """Create or refresh the session cookie using basic auth."""
         async with self._login_lock:
             if self._logged_in and not force:
                 return
+            await self._async_login_locked()
+
+    async def _async_relogin(self, generation: int) -> None:
+        """Log in again after the session of `generation` was rejected."""
+        async with self._login_lock:
+            if self._logged_in and self._login_generation != generation:
+                self.stats.shared_logins += 1
+                return
+            await self._async_login_locked()
+
+    async def _async_login_locked(self, *, renew: bool = False) -> None:
+        """Log in; the caller must hold the login lock.
+
+        A renewal keeps the current session in use until the new one is set up,
+        so requests made meanwhile do not wait for the login.
+        """
+        _LOGGER.debug("Logging in to Den Haag parking")
+        if not renew:
+            self._logged_in = False
+        await self._request_json_with_retry(
+            "GET",
+            "/api/session/0",
+            auth=True,
+            headers={"x-session-policy": "Keep-Alive"},
+        )
+        self._logged_in = True
+        self._login_generation += 1
+        self._login_time = time.monotonic()
+        self.stats.logins += 1
+        if (cookie_lifetime := self._cookie_lifetime()) is not None:
+            self._observe_session_lifetime(cookie_lifetime)
+        self._schedule_session_renewal()
+        if self._on_login is not None:
+            self._on_login()
 
-            _LOGGER.debug("Logging in to Den Haag parking")
-            await self._request_json_once(
-                "GET",
-                "/api/session/0",
-                auth=True,
-                headers={"x-session-policy": "Keep-Alive"},
+    def export_session(self) -> dict[str, Any] | None:
+        """Return the session cookies and learned lifetime for persistence."""
+        if not self._logged_in:
+            return None
+        if not (cookies := {morsel.key: morsel.value for morsel in self._session.cookie_jar}):
+            return None
+        expires_at: float | None = None
+        if self._login_time is not None and self._session_lifetime is not None:
+            expires_at = time.time() + (
+                self._login_time + self._session_lifetime - time.monotonic()
             )
-            self._logged_in = True
+        return {
+            "cookies": cookies,
+            "session_lifetime": self._session_lifetime,
+            "expires_at": expires_at,
+        }
+
+    def restore_session(self, data: Mapping[str, Any]) -> bool:
+        """Reuse a persisted session until the API rejects it."""
+        cookies = data.get("cookies")
+        if not isinstance(cookies, Mapping) or not cookies:
+            return False
+        expires_at = data.get("expires_at")
+        remaining = (
+            expires_at - time.time() if isinstance(expires_at, (int, float)) else None
+        )
+        if remaining is not None and remaining <= 0:
+            return False
+
+        self._session.cookie_jar.update_cookies(
+            {str(key): str(value) for key, value in cookies.items()},
+            URL(self._base_url),
+        )
+        lifetime = data.get("session_lifetime")
+        if isinstance(lifetime, (int, float)) and lifetime > 0:
+            self._session_lifetime = float(lifetime)
+            if remaining is not None:
+                self._login_time = time.monotonic() - (lifetime - remaining)
+        self._logged_in = True
+        self._schedule_session_renewal()
+        return True
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the state of the circuit breaker."""
+        return self._circuit_breaker.state
+
+    @property
+    def session_lifetime(self) -> float | None:
+        """Return the learned session lifetime in seconds, if known."""
+        return self._session_lifetime
+
+    def close(self) -> None:
+        """Stop background session renewal."""
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+            self._renew_handle = None
+        if self._renew_task is not None and not self._renew_task.done():
+            self._renew_task.cancel()
+        self._renew_task = None
+
+    def _cookie_lifetime(self) -> float | None:
+        """Return the shortest lifetime announced by the session cookies."""
+        lifetimes: list[float] = []
+        now = time.time()
+        for morsel in self._session.cookie_jar:
+            if (max_age := morsel["max-age"]) and max_age.lstrip("-").isdigit():
+                lifetimes.append(float(max_age))
+            elif expires := morsel["expires"]:
+                try:
+                    lifetimes.append(parsedate_to_datetime(expires).timestamp() - now)
+                except (TypeError, ValueError):
+                    continue
+        return min(lifetimes) if lifetimes else None
+
+    def _observe_session_lifetime(self, lifetime: float) -> None:
+        """Record an announced or observed session lifetime."""
+        if lifetime < _MIN_SESSION_LIFETIME:
+            return
+        if self._session_lifetime is None or lifetime < self._session_lifetime:
+            _LOGGER.debug("Session lifetime is %.0f seconds", lifetime)
+            self._session_lifetime = lifetime
+
+    def _session_expiring(self) -> bool:
+        """Return whether the current session is predicted to be (almost) expired."""
+        if self._login_time is None or self._session_lifetime is None:
+            return False
+        return time.monotonic() >= self._login_time + self._session_lifetime - 5
 
-    async def async_fetch_account(self) -> dict[str, Any]:
+    def _schedule_session_renewal(self) -> None:
+        """Renew the session in the background shortly before it expires."""
+        if self._renew_handle is not None:
+            self._renew_handle.cancel()
+            self._renew_handle = None
+        if self._login_time is None or self._session_lifetime is None:
+            return
+        delay = max(
+            self._login_time
+            + self._session_lifetime
+            - _SESSION_RENEW_MARGIN
+            - time.monotonic(),
+            _SESSION_RENEW_MARGIN / 2,
+        )
+        self._renew_handle = asyncio.get_running_loop().call_later(
+            delay, self._renew_session
+        )
+
+    def _renew_session(self) -> None:
+        """Start a background session renewal."""
+        self._renew_handle = None
+        self._renew_task = asyncio.get_running_loop().create_task(
+            self._async_renew_session()
+        )
+
+    async def _async_renew_session(self) -> None:
+        """Replace the current session before it expires."""
+        generation = self._login_generation
+        try:
+            async with self._login_lock:
+                if self._login_generation != generation:
+                    return
+                await self._async_login_locked(renew=True)
+        except TheHagueParkingError as err:
+            # The current session stays in use until it expires or is rejected.
+            _LOGGER.debug("Could not renew the session: %s", err)
+        else:
+            self.stats.session_renewals += 1
+
+    async def async_fetch_account(self) -> TheHagueParkingAccount:
         """Fetch account data."""
-        return await self._request_json("GET", "/api/account/0")
+        account: TheHagueParkingAccount = await self._request_json(
+            "GET", "/api/account/0", parse=TheHagueParkingAccount.from_dict
+        )
+        if account.zone is not None:
+            self._zone_name = account.zone.name
+        return account
 
-    async def async_fetch_reservations(self) -> list[dict[str, Any]]:
+    async def async_fetch_reservations(
+        self,
+    ) -> tuple[TheHagueParkingReservation, ...]:
         """Fetch active reservations."""
-        return await self._request_json("GET", "/api/reservation")
+        return await self._request_json(
+            "GET", "/api/reservation", parse=parse_reservations
+        )
+
+    async def async_fetch_favorites(
+        self, *, page_size: int = FAVORITES_PAGE_SIZE
+    ) -> tuple[TheHagueParkingFavorite, ...]:
+        """Fetch all favorites."""
+        pages = [page async for page in self._async_iter_favorite_pages(page_size)]
+        if len(pages) == 1:
+            return pages[0]
+        return tuple(chain.from_iterable(pages))
 
-    async def async_fetch_favorites(self) -> list[dict[str, Any]]:
-        """Fetch favorites."""
-        headers = {"x-data-limit": "100", "x-data-offset": "0"}
-        return await self._request_json("GET", "/api/favorite", headers=headers)
+    async def async_iter_favorites(
+        self, *, page_size: int = FAVORITES_PAGE_SIZE
+    ) -> AsyncIterator[TheHagueParkingFavorite]:
+        """Yield all favorites, fetching them page by page."""
+        async for page in self._async_iter_favorite_pages(page_size):
+            for favorite in page:
+                yield favorite
 
-    async def async_fetch_end_time(self, epoch_seconds: int) -> dict[str, Any]:
+    async def _async_iter_favorite_pages(
+        self, page_size: int
+    ) -> AsyncIterator[tuple[TheHagueParkingFavorite, ...]]:
+        """Yield the favorites page by page, leaving out ones already yielded.
+
+        The next page is requested while the current one is consumed. Paging
+        stops at the first page that is shorter than `page_size` or that only
+        repeats favorites already yielded, for servers that ignore the offset.
+        """
+        loop = asyncio.get_running_loop()
+        page_task: asyncio.Task[tuple[int, tuple[TheHagueParkingFavorite, ...]]] | None
+        page_task = loop.create_task(self._async_fetch_favorites_page(0, page_size))
+        seen_ids: set[int] = set()
+        try:
+            for page in range(1, _FAVORITES_MAX_PAGES + 1):
+                count, favorites = await page_task
+                page_task = None
+                if not seen_ids.isdisjoint(favorite.id for favorite in favorites):
+                    favorites = tuple(
+                        favorite for favorite in favorites if favorite.id not in seen_ids
+                    )
+                if not favorites:
+                    return
+                seen_ids.update(favorite.id for favorite in favorites)
+                if count >= page_size and page < _FAVORITES_MAX_PAGES:
+                    page_task = loop.create_task(
+                        self._async_fetch_favorites_page(page * page_size, page_size)
+                    )
+                yield favorites
+                if page_task is None:
+                    return
+        finally:
+            if page_task is not None and not page_task.done():
+                page_task.cancel()
+
+    async def _async_fetch_favorites_page(
+        self, offset: int, limit: int
+    ) -> tuple[int, tuple[TheHagueParkingFavorite, ...]]:
+        """Fetch a single page of favorites."""
+        headers = {"x-data-limit": str(limit), "x-data-offset": str(offset)}
+        return await self._request_json(
+            "GET", "/api/favorite", headers=headers, parse=_parse_favorites_page
+        )
+
+    async def async_fetch_end_time(self, epoch_seconds: int) -> TheHagueParkingZone:
         """Fetch the zone start/end time for a given moment."""
-        return await self._request_json("GET", f"/api/end-time/{epoch_seconds}")
+        moment = datetime.fromtimestamp(epoch_seconds, UTC)
+        if (zone := self._end_time_cache.get(self._zone_name, moment)) is not None:
+            self.stats.end_time_cache_hits += 1
+            return zone
+
+        self.stats.end_time_cache_misses += 1
+        zone = await self._request_json(
+            "GET", f"/api/end-time/{epoch_seconds}", parse=_parse_zone
+        )
+        self._end_time_cache.put(self._zone_name, zone)
+        return zone
 
     async def async_create_reservation(
         self,
@@ -102,7 +779,7 @@ class TheHagueParkingClient:
         name: str | None,
         start_time: str,
         end_time: str,
-    ) -> dict[str, Any]:
+    ) -> TheHagueParkingReservation | None:
         """Create a reservation."""
         payload = {
             "id": None,
@@ -111,21 +788,31 @@ class TheHagueParkingClient:
             "start_time": start_time,
             "end_time": end_time,
         }
-        return await self._request_json("POST", "/api/reservation", json_data=payload)
+        return await self._request_json(
+            "POST",
+            "/api/reservation",
+            json_data=payload,
+            parse=TheHagueParkingReservation.from_dict,
+        )
 
     async def async_create_favorite(
         self,
         *,
         license_plate: str,
         name: str,
-    ) -> dict[str, Any]:
+    ) -> TheHagueParkingFavorite | None:
         """Create a favorite."""
         payload = {
             "id": None,
             "name": name,
             "license_plate": license_plate,
         }
-        return await self._request_json("POST", "/api/favorite", json_data=payload)
+        return await self._request_json(
+            "POST",
+            "/api/favorite",
+            json_data=payload,
+            parse=TheHagueParkingFavorite.from_dict,
+        )
 
     async def async_update_favorite(
         self,
@@ -133,16 +820,19 @@ class TheHagueParkingClient:
         favorite_id: int,
         license_plate: str,
         name: str,
-    ) -> dict[str, Any]:
+    ) -> TheHagueParkingFavorite | None:
         """Update a favorite."""
         payload = {"name": name, "license_plate": license_plate}
         path = f"/api/favorite/{favorite_id}"
+        parse = TheHagueParkingFavorite.from_dict
         try:
-            return await self._request_json("PATCH", path, json_data=payload)
+            return await self._request_json(
+                "PATCH", path, json_data=payload, parse=parse
+            )
         except TheHagueParkingResponseError as err:
             if err.status != 405:
                 raise
-        return await self._request_json("PUT", path, json_data=payload)
+        return await self._request_json("PUT", path, json_data=payload, parse=parse)
 
     async def async_delete_favorite(self, favorite_id: int) -> None:
         """Delete a favorite."""
@@ -153,18 +843,79 @@ class TheHagueParkingClient:
         *,
         reservation_id: int,
         end_time: str,
-    ) -> dict[str, Any]:
+    ) -> TheHagueParkingReservation | None:
         """Patch the reservation end time."""
         return await self._request_json(
             "PATCH",
             f"/api/reservation/{reservation_id}",
             json_data={"end_time": end_time},
+            parse=TheHagueParkingReservation.from_dict,
         )
 
     async def async_delete_reservation(self, reservation_id: int) -> None:
         """Delete a reservation."""
         await self._request_json("DELETE", f"/api/reservation/{reservation_id}")
 
+    async def async_create_reservations(
+        self, reservations: Iterable[TheHagueParkingNewReservation]
+    ) -> list[
+        TheHagueParkingBatchResult[
+            TheHagueParkingNewReservation, TheHagueParkingReservation | None
+        ]
+    ]:
+        """Create several reservations."""
+        return await self._async_batch(
+            reservations,
+            lambda reservation: self.async_create_reservation(
+                license_plate=reservation.license_plate,
+                name=reservation.name,
+                start_time=reservation.start_time,
+                end_time=reservation.end_time,
+            ),
+        )
+
+    async def async_patch_reservation_end_times(
+        self, end_times: Mapping[int, str]
+    ) -> list[TheHagueParkingBatchResult[int, TheHagueParkingReservation | None]]:
+        """Patch the end time of several reservations."""
+        return await self._async_batch(
+            end_times,
+            lambda reservation_id: self.async_patch_reservation_end_time(
+                reservation_id=reservation_id, end_time=end_times[reservation_id]
+            ),
+        )
+
+    async def async_delete_reservations(
+        self, reservation_ids: Iterable[int]
+    ) -> list[TheHagueParkingBatchResult[int, None]]:
+        """Delete several reservations."""
+        return await self._async_batch(reservation_ids, self.async_delete_reservation)
+
+    async def _async_batch[ItemT, ResultT](
+        self,
+        items: Iterable[ItemT],
+        func: Callable[[ItemT], Awaitable[ResultT]],
+    ) -> list[TheHagueParkingBatchResult[ItemT, ResultT]]:
+        """Run `func` for every item with bounded concurrency.
+
+        The session is checked once up front; a failing login is raised instead
+        of being reported for every item.
+        """
+        if not (items := list(items)):
+            return []
+
+        await self.async_login()
+        semaphore = asyncio.Semaphore(self._batch_concurrency)
+
+        async def _async_run(item: ItemT) -> TheHagueParkingBatchResult[ItemT, ResultT]:
+            async with semaphore:
+                try:
+                    return TheHagueParkingBatchResult(item, result=await func(item))
+                except TheHagueParkingError as err:
+                    return TheHagueParkingBatchResult(item, error=err)
+
+        return list(await asyncio.gather(*(_async_run(item) for item in items)))
+
     async def _request_json(
         self,
         method: str,
@@ -172,30 +923,155 @@ class TheHagueParkingClient:
         *,
         headers: dict[str, str] | None = None,
         json_data: Any | None = None,
+        parse: Callable[[Any], Any] | None = None,
+    ) -> Any:
+        """Make a JSON request and return the parsed response.
+
+        `parse` converts the decoded JSON once, before it is cached or shared.
+        Concurrent identical GET requests share a single HTTP round trip, unless
+        a mutating request was sent in between.
+        """
+        if method != "GET":
+            # GETs started before or during this change may miss it; GETs sent
+            # after it must not join them.
+            self._inflight.clear()
+            try:
+                return await self._request_json_authenticated(
+                    method, path, headers=headers, json_data=json_data, parse=parse
+                )
+            finally:
+                self._inflight.clear()
+
+        key = _request_key(path, headers)
+        if (task := self._inflight.get(key)) is not None:
+            self.stats.coalesced_requests += 1
+        else:
+            task = asyncio.get_running_loop().create_task(
+                self._request_json_authenticated(
+                    method, path, headers=headers, parse=parse
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._inflight_done, key))
+
+        # Shield the shared request so a cancelled caller does not cancel it for
+        # the other callers waiting on the same result.
+        return await asyncio.shield(task)
+
+    def _inflight_done(self, key: _RequestKey, task: asyncio.Task[Any]) -> None:
+        """Forget a finished in-flight request."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller was cancelled.
+            task.exception()
+
+    async def _request_json_authenticated(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json_data: Any | None = None,
+        parse: Callable[[Any], Any] | None = None,
     ) -> Any:
-        """Make a JSON request and return the parsed response."""
+        """Make a JSON request using the session, logging in when needed."""
         if not self._logged_in:
             await self.async_login()
+        elif self._session_expiring():
+            await self._async_relogin(self._login_generation)
 
+        generation = self._login_generation
         try:
-            return await self._request_json_once(
+            return await self._request_json_with_retry(
                 method,
                 path,
                 headers=headers,
                 json_data=json_data,
+                parse=parse,
                 auth=False,
             )
         except TheHagueParkingAuthError:
-            self._logged_in = False
-            await self.async_login(force=True)
-            return await self._request_json_once(
+            # Sessions restored from storage (generation 0) may have been
+            # revoked for other reasons, so only learn from our own logins.
+            if (
+                generation
+                and generation == self._login_generation
+                and self._login_time is not None
+            ):
+                self._observe_session_lifetime(time.monotonic() - self._login_time)
+            await self._async_relogin(generation)
+            return await self._request_json_with_retry(
                 method,
                 path,
                 headers=headers,
                 json_data=json_data,
+                parse=parse,
                 auth=False,
             )
 
+    async def _request_json_with_retry(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: dict[str, str] | None = None,
+        json_data: Any | None = None,
+        parse: Callable[[Any], Any] | None = None,
+        auth: bool,
+    ) -> Any:
+        """Make a request, retrying idempotent methods on transient failures."""
+        policy = self._retry_policy
+        attempts = max(policy.attempts, 1) if method in policy.methods else 1
+        breaker = self._circuit_breaker
+        attempt = 0
+        while True:
+            try:
+                breaker.before_request()
+            except TheHagueParkingCircuitOpenError:
+                self.stats.short_circuited += 1
+                raise
+
+            try:
+                result = await self._request_json_once(
+                    method,
+                    path,
+                    headers=headers,
+                    json_data=json_data,
+                    parse=parse,
+                    auth=auth,
+                )
+            except asyncio.CancelledError:
+                breaker.release_probe()
+                raise
+            except (TheHagueParkingConnectionError, TheHagueParkingResponseError) as err:
+                if (
+                    isinstance(err, TheHagueParkingResponseError)
+                    and err.status < 500
+                ):
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                attempt += 1
+                if attempt >= attempts or breaker.state is not CircuitState.CLOSED:
+                    raise
+                self.stats.retries += 1
+                delay = policy.delay(attempt - 1)
+                _LOGGER.debug(
+                    "%s %s failed (%s), retrying in %.1f seconds",
+                    method,
+                    path,
+                    err,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            except TheHagueParkingAuthError:
+                breaker.record_success()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
     async def _request_json_once(
         self,
         method: str,
@@ -203,6 +1079,7 @@ class TheHagueParkingClient:
         *,
         headers: dict[str, str] | None = None,
         json_data: Any | None = None,
+        parse: Callable[[Any], Any] | None = None,
         auth: bool,
     ) -> Any:
         url = f"{self._base_url}{path}"
@@ -213,6 +1090,20 @@ class TheHagueParkingClient:
         if headers:
             request_headers.update(headers)
 
+        # Only session-authenticated GETs of polled endpoints are cached; the
+        # cached body is shared with every caller and must be treated as read-only.
+        cache_key = (
+            _request_key(path, headers)
+            if method == "GET" and not auth and path in _CONDITIONAL_CACHE_PATHS
+            else None
+        )
+        cached = self._response_cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            if cached.etag:
+                request_headers[hdrs.IF_NONE_MATCH] = cached.etag
+            if cached.last_modified:
+                request_headers[hdrs.IF_MODIFIED_SINCE] = cached.last_modified
+
         basic_auth = None
         if auth:
             basic_auth = aiohttp.BasicAuth(
@@ -220,6 +1111,7 @@ class TheHagueParkingClient:
                 self._credentials.password,
             )
 
+        self.stats.requests += 1
         try:
             async with asyncio.timeout(self._timeout):
                 async with self._session.request(
@@ -232,19 +1124,43 @@ class TheHagueParkingClient:
                     if response.status in (401, 403):
                         raise TheHagueParkingAuthError
 
+                    # Read the body once; decoding and error reporting reuse it.
+                    raw = await response.read()
                     if response.status >= 400:
                         raise TheHagueParkingResponseError(
-                            response.status, await response.text()
+                            response.status, raw.decode(errors="replace")
                         )
 
+                    if response.status == 304 and cached is not None:
+                        self.stats.cache_hits += 1
+                        self.stats.cache_bytes_saved += cached.size
+                        return cached.body
+
                     if response.status == 204:
-                        return None
+                        return parse(None) if parse else None
 
                     try:
-                        return await response.json(content_type=None)
-                    except (aiohttp.ClientResponseError, json.JSONDecodeError) as err:
+                        body = json_loads(raw) if raw.strip() else None
+                    except ValueError as err:
                         raise TheHagueParkingResponseError(
-                            response.status, await response.text()
+                            response.status, raw.decode(errors="replace")
                         ) from err
+                    if parse is not None:
+                        body = parse(body)
+
+                    if cache_key is not None:
+                        self.stats.cache_misses += 1
+                        etag = response.headers.get(hdrs.ETAG)
+                        last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+                        if etag or last_modified:
+                            self._response_cache[cache_key] = _CachedResponse(
+                                etag=etag,
+                                last_modified=last_modified,
+                                size=len(raw),
+                                body=body,
+                            )
+                        else:
+                            self._response_cache.pop(cache_key, None)
+                    return body
         except (TimeoutError, aiohttp.ClientError) as err:
             raise TheHagueParkingConnectionError from err
@@ -1,6 +1,7 @@
 """Config flow for Den Haag parking."""
 from __future__ import annotations
 
+from datetime import datetime
 import logging
 from typing import Any
 
@@ -19,6 +20,7 @@ from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.util import dt as dt_util
 
 from .api import (
+    TheHagueParkingAccount,
     TheHagueParkingAuthError,
     TheHagueParkingClient,
     TheHagueParkingConnectionError,
@@ -28,10 +30,14 @@ from .api import (
 from .const import (
     CONF_AUTO_END_ENABLED,
     CONF_DESCRIPTION,
+    CONF_END_AT_SCHEDULE,
+    CONF_MAX_STALE_MINUTES,
     CONF_SCHEDULE,
     CONF_WORKDAYS,
     CONF_WORKING_FROM,
     CONF_WORKING_TO,
+    DATA_PENDING_SESSIONS,
+    DEFAULT_MAX_STALE_MINUTES,
     DEFAULT_WORKING_FROM,
     DEFAULT_WORKING_TO,
     DOMAIN,
@@ -104,16 +110,11 @@ def _parse_schedule(value: object) -> dict[int, dict[str, object]] | None:
     return schedule or None
 
 
-def _zone_time_to_hhmm(value: object) -> str | None:
-    """Convert a zone datetime string to local HH:MM."""
-    if not isinstance(value, str):
+def _zone_time_to_hhmm(value: datetime | None) -> str | None:
+    """Convert a zone datetime to local HH:MM."""
+    if value is None:
         return None
-    parsed = dt_util.parse_datetime(value)
-    if parsed is None:
-        return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-    local = dt_util.as_local(parsed)
+    local = dt_util.as_local(value)
     return f"{local.hour:02d}:{local.minute:02d}"
 
 
@@ -123,13 +124,17 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
     VERSION = 1
     MINOR_VERSION = 2
 
+    _session_data: dict[str, Any] | None = None
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> OptionsFlow:
         """Return the options flow handler."""
         return TheHagueParkingOptionsFlowHandler(config_entry)
 
-    async def _async_get_account(self, username: str, password: str) -> dict[str, Any]:
+    async def _async_get_account(
+        self, username: str, password: str
+    ) -> TheHagueParkingAccount:
         """Log in and fetch account data."""
         # Use a dedicated session with an isolated cookie jar: the login flow
         # relies on cookies and should not pollute the shared Home Assistant
@@ -149,23 +154,20 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
         )
         try:
             await client.async_login()
-            return await client.async_fetch_account()
+            account = await client.async_fetch_account()
+            self._session_data = client.export_session()
+            return account
         finally:
+            client.close()
             await session.close()
 
-    def _account_id_from_account(self, account: object) -> str | None:
-        """Return the account id as a string, if available."""
-        if not isinstance(account, dict):
-            return None
-        account_id = account.get("id")
-        if isinstance(account_id, int):
-            return str(account_id)
-        if isinstance(account_id, str):
-            account_id = account_id.strip()
-            if not account_id or account_id.casefold() == "none":
-                return None
-            return account_id or None
-        return None
+    @callback
+    def _async_hand_over_session(self, account_id: str) -> None:
+        """Let the entry setup reuse the session created by this flow."""
+        if self._session_data is not None:
+            self.hass.data.setdefault(DATA_PENDING_SESSIONS, {})[account_id] = (
+                self._session_data
+            )
 
     def _user_schema(self, user_input: dict[str, str] | None) -> vol.Schema:
         """Build the user step schema, keeping non-sensitive defaults."""
@@ -202,7 +204,7 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected error while fetching account data")
                 errors["base"] = "unknown"
             else:
-                account_id = self._account_id_from_account(account)
+                account_id = account.id
                 if account_id is None:
                     _LOGGER.error("Account response did not include a valid id")
                     errors["base"] = "missing_account_id"
@@ -214,6 +216,7 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
 
                 await self.async_set_unique_id(account_id)
                 self._abort_if_unique_id_configured()
+                self._async_hand_over_session(account_id)
                 return self.async_create_entry(
                     title=f"Account {account_id}",
                     data={
@@ -268,7 +271,7 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected error while fetching account data during re-auth")
                 errors["base"] = "unknown"
             else:
-                account_id = self._account_id_from_account(account)
+                account_id = account.id
                 if account_id is None:
                     _LOGGER.error("Account response did not include a valid id during re-auth")
                     errors["base"] = "missing_account_id"
@@ -291,6 +294,7 @@ class TheHagueParkingConfigFlow(ConfigFlow, domain=DOMAIN):
                         reauth_entry, unique_id=account_id
                     )
 
+                self._async_hand_over_session(account_id)
                 return self.async_update_reload_and_abort(
                     reauth_entry,
                     data_updates={CONF_PASSWORD: password},
@@ -360,7 +364,9 @@ class TheHagueParkingOptionsFlowHandler(OptionsFlow):
                 **self._config_entry.options,
                 CONF_DESCRIPTION: description,
                 CONF_AUTO_END_ENABLED: auto_end_enabled,
+                CONF_END_AT_SCHEDULE: bool(user_input.get(CONF_END_AT_SCHEDULE, False)),
                 CONF_SCHEDULE: schedule,
+                CONF_MAX_STALE_MINUTES: user_input[CONF_MAX_STALE_MINUTES],
             }
             return self.async_create_entry(title="", data=options_data)
 
@@ -383,15 +389,11 @@ class TheHagueParkingOptionsFlowHandler(OptionsFlow):
             runtime_data = self.hass.data.get(DOMAIN, {}).get(self._config_entry.entry_id)
             coordinator = getattr(runtime_data, "coordinator", None)
             account = getattr(getattr(coordinator, "data", None), "account", None)
-            zone = account.get("zone") if isinstance(account, dict) else None
+            zone = account.zone if isinstance(account, TheHagueParkingAccount) else None
             if base_from is None:
-                base_from = _zone_time_to_hhmm(
-                    zone.get("start_time") if isinstance(zone, dict) else None
-                )
+                base_from = _zone_time_to_hhmm(zone.start_time if zone else None)
             if base_to is None:
-                base_to = _zone_time_to_hhmm(
-                    zone.get("end_time") if isinstance(zone, dict) else None
-                )
+                base_to = _zone_time_to_hhmm(zone.end_time if zone else None)
 
         base_from = base_from or DEFAULT_WORKING_FROM
         base_to = base_to or DEFAULT_WORKING_TO
@@ -407,6 +409,14 @@ class TheHagueParkingOptionsFlowHandler(OptionsFlow):
                 CONF_AUTO_END_ENABLED,
                 default=bool(defaults_map.get(CONF_AUTO_END_ENABLED, auto_end_enabled)),
             ): bool,
+            vol.Required(
+                CONF_END_AT_SCHEDULE,
+                default=bool(
+                    defaults_map.get(
+                        CONF_END_AT_SCHEDULE, options.get(CONF_END_AT_SCHEDULE, False)
+                    )
+                ),
+            ): bool,
         }
         for day, key in _DAY_KEYS:
             raw_day_cfg = schedule.get(day)
@@ -437,6 +447,18 @@ class TheHagueParkingOptionsFlowHandler(OptionsFlow):
                 )
             ] = str
 
+        schema_dict[
+            vol.Required(
+                CONF_MAX_STALE_MINUTES,
+                default=int(
+                    defaults_map.get(
+                        CONF_MAX_STALE_MINUTES,
+                        options.get(CONF_MAX_STALE_MINUTES, DEFAULT_MAX_STALE_MINUTES),
+                    )
+                ),
+            )
+        ] = vol.All(vol.Coerce(int), vol.Range(min=0, max=1440))
+
         return vol.Schema(
             schema_dict
         )
@@ -5,9 +5,18 @@ DOMAIN = "thehague_parking"
 
 API_BASE_URL = "https://parkerendenhaag.denhaag.nl"
 
+# hass.data key for sessions created by the config flow, keyed by unique id and
+# handed over to the entry setup so it does not need to log in again.
+DATA_PENDING_SESSIONS = f"{DOMAIN}_pending_sessions"
+
 CONF_DESCRIPTION = "description"
 CONF_AUTO_END_ENABLED = "auto_end_enabled"
+CONF_END_AT_SCHEDULE = "end_at_schedule"
 CONF_SCHEDULE = "schedule"
+CONF_MAX_STALE_MINUTES = "max_stale_minutes"
+
+# Keep serving the last data this long while the API cannot be reached.
+DEFAULT_MAX_STALE_MINUTES = 60
 
 # Legacy schedule options (kept for backwards compatibility/migration)
 CONF_WORKDAYS = "workdays"
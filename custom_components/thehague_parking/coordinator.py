@@ -2,38 +2,119 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from datetime import timedelta
+from collections.abc import Collection, Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from enum import StrEnum
+from functools import partial
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from .api import (
+    CircuitState,
+    TheHagueParkingAccount,
     TheHagueParkingAuthError,
+    TheHagueParkingCircuitOpenError,
     TheHagueParkingClient,
     TheHagueParkingConnectionError,
     TheHagueParkingError,
+    TheHagueParkingFavorite,
+    TheHagueParkingReservation,
+    TheHagueParkingResponseError,
+    parse_favorites,
+    parse_reservations,
 )
-from .const import DOMAIN
+from .const import CONF_MAX_STALE_MINUTES, DEFAULT_MAX_STALE_MINUTES, DOMAIN
+from .schedule import CompiledSchedule
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reservations are polled every minute while a reservation or the paid-parking
+# window is active, backing off up to MAX_ACTIVE_UPDATE_INTERVAL while responses
+# do not change. Account data follows the reservations while a reservation is
+# active (debit minutes are consumed), favorites rarely change.
+FAST_UPDATE_INTERVAL = timedelta(minutes=1)
+MAX_ACTIVE_UPDATE_INTERVAL = timedelta(minutes=5)
+IDLE_UPDATE_INTERVAL = timedelta(minutes=15)
+ACCOUNT_UPDATE_INTERVAL = timedelta(minutes=15)
+FAVORITES_UPDATE_INTERVAL = timedelta(hours=1)
+# Poll fast for a while after a service call changed something.
+BOOST_DURATION = timedelta(minutes=5)
+# Poll this long after an upcoming start/end event to pick up its effect.
+_EVENT_GRACE = timedelta(seconds=5)
+_MIN_EVENT_UPDATE_INTERVAL = timedelta(seconds=30)
+# Refresh requests arriving within this window share one update.
+REFRESH_WINDOW = 2.0
+# Resources due within this margin are fetched together with the current update.
+_DUE_TOLERANCE = timedelta(seconds=5)
+
+
+class TheHagueParkingResource(StrEnum):
+    """Independently refreshed parts of the coordinator data."""
+
+    ACCOUNT = "account"
+    RESERVATIONS = "reservations"
+    FAVORITES = "favorites"
+
 
 @dataclass(frozen=True, slots=True)
 class TheHagueParkingData:
     """Data returned by the coordinator."""
 
-    account: dict[str, Any]
-    reservations: list[dict[str, Any]]
-    favorites: list[dict[str, Any]]
+    account: TheHagueParkingAccount
+    reservations: tuple[TheHagueParkingReservation, ...]
+    favorites: tuple[TheHagueParkingFavorite, ...]
+    # Set while the data is restored from storage or served during an outage.
+    stale: bool = False
+    # Lookups built once per snapshot.
+    reservations_by_id: Mapping[int, TheHagueParkingReservation] = field(
+        init=False, repr=False, compare=False
+    )
+    favorites_by_id: Mapping[int, TheHagueParkingFavorite] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the lookups."""
+        set_field = partial(object.__setattr__, self)
+        set_field(
+            "reservations_by_id",
+            {reservation.id: reservation for reservation in self.reservations},
+        )
+        set_field("favorites_by_id", {favorite.id: favorite for favorite in self.favorites})
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the data in a JSON-serializable form."""
+        return {
+            "account": self.account.as_dict(),
+            "reservations": [reservation.as_dict() for reservation in self.reservations],
+            "favorites": [favorite.as_dict() for favorite in self.favorites],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> TheHagueParkingData:
+        """Restore data from its stored form."""
+        return cls(
+            account=TheHagueParkingAccount.from_dict(data.get("account")),
+            reservations=parse_reservations(data.get("reservations")),
+            favorites=parse_favorites(data.get("favorites")),
+        )
 
 
 class TheHagueParkingCoordinator(DataUpdateCoordinator[TheHagueParkingData]):
-    """Coordinator to fetch data from the Den Haag parking API."""
+    """Coordinator to fetch data from the Den Haag parking API.
+
+    Account, reservations and favorites are refreshed on their own cadence;
+    an update only fetches the resources that are due or were invalidated, and
+    listeners registered with a resource as context are only called when that
+    resource changed. An update that changes nothing calls no such listener.
+    """
 
     def __init__(
         self,
@@ -47,26 +128,341 @@ class TheHagueParkingCoordinator(DataUpdateCoordinator[TheHagueParkingData]):
             hass,
             logger=_LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=1),
+            update_interval=FAST_UPDATE_INTERVAL,
             config_entry=config_entry,
         )
         self.client = client
+        # Compiled auto-end schedule, when auto-end is enabled.
+        self.schedule: CompiledSchedule | None = None
+        self.poll_count = 0
+        # When the API last confirmed the data.
+        self.data_updated: datetime | None = None
         self._unavailable_logged = False
+        self._unchanged_polls = 0
+        self._boost_until: datetime | None = None
+        self._due: dict[TheHagueParkingResource, datetime] = {}
+        self._invalidated: set[TheHagueParkingResource] = set()
+        # Bumped whenever a fetched resource differs from the previous snapshot.
+        self._versions: dict[TheHagueParkingResource, int] = {}
+        # Resources changed by the last update; None notifies every listener.
+        self._updated_resources: set[TheHagueParkingResource] | None = None
+        # Resolved by the update that serves the requests of the current window.
+        self._refresh_future: asyncio.Future[None] | None = None
+        self._refresh_timer: asyncio.TimerHandle | None = None
+
+    @property
+    def circuit_state(self) -> CircuitState:
+        """Return the state of the API circuit breaker."""
+        return self.client.circuit_state
+
+    @property
+    def resource_due(self) -> dict[TheHagueParkingResource, datetime]:
+        """Return when each resource is refreshed next."""
+        return dict(self._due)
+
+    @property
+    def resource_versions(self) -> dict[TheHagueParkingResource, int]:
+        """Return how often each resource changed since setup."""
+        return dict(self._versions)
+
+    @callback
+    def async_restore_snapshot(
+        self, data: TheHagueParkingData, updated: datetime
+    ) -> None:
+        """Start from persisted data until the first successful update."""
+        self.data = replace(data, stale=True)
+        self.data_updated = updated
+
+    @callback
+    def async_boost_polling(self) -> None:
+        """Poll at the fast interval for a while, e.g. after a service call."""
+        now = dt_util.utcnow()
+        self._boost_until = now + BOOST_DURATION
+        self._unchanged_polls = 0
+        due = self._due.get(TheHagueParkingResource.RESERVATIONS)
+        if due is None or due > now + FAST_UPDATE_INTERVAL:
+            self._due[TheHagueParkingResource.RESERVATIONS] = now + FAST_UPDATE_INTERVAL
+        self.update_interval = FAST_UPDATE_INTERVAL
+
+    @callback
+    def async_invalidate(self, *resources: TheHagueParkingResource) -> None:
+        """Fetch the given resources (default: all) on the next update."""
+        self._invalidated.update(resources or TheHagueParkingResource)
+
+    async def async_refresh_resources(self, *resources: TheHagueParkingResource) -> None:
+        """Refresh the given resources (default: all) together with other requests.
+
+        Requests arriving within REFRESH_WINDOW share one update; this returns
+        once an update that started after the request has finished.
+        """
+        self.async_invalidate(*resources)
+        if self._refresh_future is None:
+            self._refresh_future = self.hass.loop.create_future()
+            self._refresh_timer = self.hass.loop.call_later(
+                REFRESH_WINDOW, self._async_start_scheduled_refresh
+            )
+        await asyncio.shield(self._refresh_future)
+
+    @callback
+    def _async_start_scheduled_refresh(self) -> None:
+        # Detach the future first: requests arriving during the update may
+        # follow changes it does not reflect, so they open a new window.
+        future, self._refresh_future = self._refresh_future, None
+        self._refresh_timer = None
+        if future is not None:
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_scheduled_refresh(future),
+                f"{DOMAIN} scheduled refresh",
+            )
+
+    async def _async_scheduled_refresh(self, future: asyncio.Future[None]) -> None:
+        try:
+            await self.async_refresh()
+        finally:
+            if not future.done():
+                future.set_result(None)
+
+    async def async_refresh_after_change(
+        self, *resources: TheHagueParkingResource
+    ) -> None:
+        """Refresh the resources a service changed and keep polling fast."""
+        self.async_boost_polling()
+        await self.async_refresh_resources(*resources)
+
+    @callback
+    def async_schedule_reconcile(self, *resources: TheHagueParkingResource) -> None:
+        """Refresh the given resources with the next scheduled refresh."""
+        self.async_boost_polling()
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_refresh_resources(*resources),
+            f"{DOMAIN} reconcile",
+        )
+
+    @callback
+    def _async_set_resource(
+        self, resource: TheHagueParkingResource, value: object
+    ) -> None:
+        """Replace one resource in the snapshot and update its listeners."""
+        if self.data is None or getattr(self.data, resource) == value:
+            return
+        self._versions[resource] = self._versions.get(resource, 0) + 1
+        # Marking the data as updated makes every entity available again.
+        self._updated_resources = {resource} if self.last_update_success else None
+        self.async_set_updated_data(replace(self.data, **{resource: value}))
+
+    @callback
+    def async_upsert_reservation(self, reservation: TheHagueParkingReservation) -> None:
+        """Apply a created or changed reservation before the API is polled again."""
+        if self.data is None:
+            return
+        reservations = list(self.data.reservations)
+        if reservation.id in self.data.reservations_by_id:
+            reservations = [
+                item for item in reservations if item.id != reservation.id
+            ]
+        reservations.append(reservation)
+        self._async_set_resource(
+            TheHagueParkingResource.RESERVATIONS, tuple(reservations)
+        )
+        self.async_schedule_reconcile(
+            TheHagueParkingResource.RESERVATIONS, TheHagueParkingResource.ACCOUNT
+        )
+
+    @callback
+    def async_remove_reservations(self, reservation_ids: Collection[int]) -> None:
+        """Drop deleted reservations before the API is polled again."""
+        if self.data is None:
+            return
+        self._async_set_resource(
+            TheHagueParkingResource.RESERVATIONS,
+            tuple(
+                item for item in self.data.reservations if item.id not in reservation_ids
+            ),
+        )
+        self.async_schedule_reconcile(
+            TheHagueParkingResource.RESERVATIONS, TheHagueParkingResource.ACCOUNT
+        )
+
+    @callback
+    def async_upsert_favorite(self, favorite: TheHagueParkingFavorite) -> None:
+        """Apply a created or changed favorite before the API is polled again."""
+        if self.data is None:
+            return
+        favorites = list(self.data.favorites)
+        if favorite.id in self.data.favorites_by_id:
+            favorites = [item for item in favorites if item.id != favorite.id]
+        favorites.append(favorite)
+        self._async_set_resource(TheHagueParkingResource.FAVORITES, tuple(favorites))
+        self.async_schedule_reconcile(TheHagueParkingResource.FAVORITES)
+
+    @callback
+    def async_remove_favorite(self, favorite_id: int) -> None:
+        """Drop a deleted favorite before the API is polled again."""
+        if self.data is None:
+            return
+        self._async_set_resource(
+            TheHagueParkingResource.FAVORITES,
+            tuple(item for item in self.data.favorites if item.id != favorite_id),
+        )
+        self.async_schedule_reconcile(TheHagueParkingResource.FAVORITES)
+
+    async def async_shutdown(self) -> None:
+        """Cancel a scheduled refresh and shut down the coordinator."""
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if (future := self._refresh_future) is not None:
+            self._refresh_future = None
+            future.set_result(None)
+        await super().async_shutdown()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of the resources changed by the last update."""
+        updated = self._updated_resources
+        self._updated_resources = None
+        if updated is not None and not updated:
+            return
+        for update_callback, context in list(self._listeners.values()):
+            if updated is None or context is None or context in updated:
+                update_callback()
+
+    def _due_resources(self, now: datetime) -> list[TheHagueParkingResource]:
+        """Return the resources to fetch in this update."""
+        if self.data is None:
+            return list(TheHagueParkingResource)
+        due = [
+            resource
+            for resource in TheHagueParkingResource
+            if resource in self._invalidated
+            or self._due.get(resource, now) <= now + _DUE_TOLERANCE
+        ]
+        # A refresh requested without anything being due fetches everything.
+        return due or list(TheHagueParkingResource)
+
+    def _reservations_interval(
+        self, data: TheHagueParkingData, now: datetime
+    ) -> tuple[timedelta, bool]:
+        """Return the reservations polling interval and whether one is active."""
+        events: list[datetime] = []
+        reservation_active = False
+        zone_active = False
+        for reservation in data.reservations:
+            start, end = reservation.start_time, reservation.end_time
+            if start is not None and end is not None and start <= now < end:
+                reservation_active = True
+            events.extend(moment for moment in (start, end) if moment is not None)
+        if (zone := data.account.zone) is not None:
+            if (
+                zone.start_time is not None
+                and zone.end_time is not None
+                and zone.start_time <= now < zone.end_time
+            ):
+                zone_active = True
+            events.extend(
+                moment for moment in (zone.start_time, zone.end_time) if moment is not None
+            )
+        if self.schedule is not None and (
+            schedule_end := next(self.schedule.iter_ends_after(now), None)
+        ):
+            events.append(schedule_end)
+
+        if self._boost_until is not None and now < self._boost_until:
+            return FAST_UPDATE_INTERVAL, reservation_active
+        if reservation_active or zone_active:
+            interval = min(
+                FAST_UPDATE_INTERVAL * 2 ** min(self._unchanged_polls, 8),
+                MAX_ACTIVE_UPDATE_INTERVAL,
+            )
+        else:
+            interval = IDLE_UPDATE_INTERVAL
+
+        # Do not sleep past the next event that changes what is active.
+        if upcoming := [moment for moment in events if moment > now]:
+            interval = min(
+                interval,
+                max(min(upcoming) - now + _EVENT_GRACE, _MIN_EVENT_UPDATE_INTERVAL),
+            )
+        return interval, reservation_active
+
+    def _schedule_resources(
+        self,
+        data: TheHagueParkingData,
+        fetched: Iterable[TheHagueParkingResource],
+        now: datetime,
+    ) -> None:
+        """Set the next due time of the fetched resources and the update interval."""
+        interval, reservation_active = self._reservations_interval(data, now)
+        for resource in fetched:
+            match resource:
+                case TheHagueParkingResource.RESERVATIONS:
+                    self._due[resource] = now + interval
+                case TheHagueParkingResource.ACCOUNT:
+                    self._due[resource] = now + (
+                        interval if reservation_active else ACCOUNT_UPDATE_INTERVAL
+                    )
+                case TheHagueParkingResource.FAVORITES:
+                    self._due[resource] = now + FAVORITES_UPDATE_INTERVAL
+        if reservation_active:
+            account_due = self._due.get(TheHagueParkingResource.ACCOUNT, now)
+            self._due[TheHagueParkingResource.ACCOUNT] = min(account_due, now + interval)
+
+        self.update_interval = max(
+            min(self._due.values()) - now, _MIN_EVENT_UPDATE_INTERVAL
+        )
+
+    def _serve_stale(self, now: datetime) -> TheHagueParkingData | None:
+        """Return the previous data during an outage while it is recent enough."""
+        max_age = timedelta(
+            minutes=self.config_entry.options.get(
+                CONF_MAX_STALE_MINUTES, DEFAULT_MAX_STALE_MINUTES
+            )
+        )
+        if (
+            self.data is None
+            or self.data_updated is None
+            or now - self.data_updated > max_age
+        ):
+            return None
+        _LOGGER.debug("Serving data from %s during outage", self.data_updated)
+        # Notify every listener so the data age is written; retry soon.
+        self._updated_resources = None
+        self.update_interval = FAST_UPDATE_INTERVAL
+        return replace(self.data, stale=True)
 
     async def _async_update_data(self) -> TheHagueParkingData:
+        now = dt_util.utcnow()
+        resources = self._due_resources(now)
+        invalidated = set(self._invalidated)
+        fetchers = {
+            TheHagueParkingResource.ACCOUNT: self.client.async_fetch_account,
+            TheHagueParkingResource.RESERVATIONS: self.client.async_fetch_reservations,
+            TheHagueParkingResource.FAVORITES: self.client.async_fetch_favorites,
+        }
         try:
             await self.client.async_login()
-            account, reservations, favorites = await asyncio.gather(
-                self.client.async_fetch_account(),
-                self.client.async_fetch_reservations(),
-                self.client.async_fetch_favorites(),
+            results = await asyncio.gather(
+                *(fetchers[resource]() for resource in resources)
             )
         except TheHagueParkingAuthError as err:
             raise ConfigEntryAuthFailed("Authentication failed") from err
-        except TheHagueParkingConnectionError as err:
+        except TheHagueParkingCircuitOpenError as err:
+            if (data := self._serve_stale(now)) is not None:
+                return data
+            raise UpdateFailed(
+                f"Cannot connect (circuit breaker {self.client.circuit_state})"
+            ) from err
+        except (TheHagueParkingConnectionError, TheHagueParkingResponseError) as err:
+            # A 5xx is an outage like a connection error; other responses are not.
+            if isinstance(err, TheHagueParkingResponseError) and err.status < 500:
+                raise UpdateFailed(str(err)) from err
             if not self._unavailable_logged:
                 _LOGGER.info("The service is unavailable: %s", err)
                 self._unavailable_logged = True
+            if (data := self._serve_stale(now)) is not None:
+                return data
             raise UpdateFailed("Cannot connect") from err
         except TheHagueParkingError as err:
             raise UpdateFailed(str(err)) from err
@@ -75,8 +471,31 @@ class TheHagueParkingCoordinator(DataUpdateCoordinator[TheHagueParkingData]):
             _LOGGER.info("The service is back online")
             self._unavailable_logged = False
 
-        return TheHagueParkingData(
-            account=account,
-            reservations=reservations,
-            favorites=favorites,
+        updates = {
+            resource: result
+            for resource, result in zip(resources, results, strict=True)
+            if self.data is None or getattr(self.data, resource) != result
+        }
+        for resource in updates:
+            self._versions[resource] = self._versions.get(resource, 0) + 1
+        was_stale = self.data is not None and self.data.stale
+        if self.data is None:
+            data = TheHagueParkingData(**updates)
+        elif updates or was_stale:
+            data = replace(self.data, **updates, stale=False)
+        else:
+            data = self.data
+
+        self.data_updated = now
+        self._invalidated.difference_update(invalidated.intersection(resources))
+        # Every listener has to run when the entities become available again or
+        # the data is no longer stale.
+        self._updated_resources = (
+            set(updates)
+            if self.data is not None and self.last_update_success and not was_stale
+            else None
         )
+        self.poll_count += 1
+        self._unchanged_polls = 0 if updates else self._unchanged_polls + 1
+        self._schedule_resources(data, resources, now)
+        return data
@@ -0,0 +1,35 @@
+"""Diagnostics support for Den Haag parking."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+
+from . import TheHagueParkingConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: TheHagueParkingConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    client = coordinator.client
+    return {
+        "options": dict(entry.options),
+        "circuit_state": coordinator.circuit_state,
+        "update_interval": (
+            coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None
+        ),
+        "poll_count": coordinator.poll_count,
+        "resource_due": {
+            resource: due.isoformat()
+            for resource, due in coordinator.resource_due.items()
+        },
+        "resource_versions": coordinator.resource_versions,
+        "client": asdict(client.stats),
+        "session_lifetime": client.session_lifetime,
+    }
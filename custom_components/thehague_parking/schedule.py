@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Collection, Mapping
-from datetime import datetime, time
+from collections.abc import Collection, Iterator, Mapping
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
 from homeassistant.util import dt as dt_util
@@ -94,97 +95,147 @@ def schedule_for_options(
     return schedule
 
 
-def end_times(schedule: Mapping[int, tuple[bool, time, time]]) -> set[tuple[int, int]]:
-    """Return the set of (hour, minute) end times for enabled schedule days."""
-    return {
-        (to_time.hour, to_time.minute)
-        for enabled, _from_time, to_time in schedule.values()
-        if enabled
-    }
+def _minutes(value: time) -> int:
+    return value.hour * 60 + value.minute
 
 
-def scheduled_end_for_start(
-    start_time: datetime, options: Mapping[str, Any]
-) -> tuple[str, datetime] | None:
-    """Return (working_to_hhmm, scheduled_end_utc) for start_time if applicable."""
-    start_local = dt_util.as_local(start_time)
-    weekday = start_local.weekday()
-    prev = (weekday - 1) % 7
-    start_clock = start_local.time().replace(second=0, microsecond=0)
+def _hhmm(minutes: int) -> str:
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
 
-    schedule_opt = options.get(CONF_SCHEDULE)
-    if isinstance(schedule_opt, Mapping):
 
-        def _cfg_for_day(day: int) -> Mapping[str, Any] | None:
-            cfg = schedule_opt.get(day)
-            if cfg is None:
-                cfg = schedule_opt.get(str(day))
-            return cfg if isinstance(cfg, Mapping) else None
+def _at_minute(day: date, minutes: int) -> datetime:
+    """Return the UTC instant of a local minute of the day."""
+    return dt_util.as_utc(
+        datetime.combine(
+            day, time(minutes // 60, minutes % 60), tzinfo=dt_util.DEFAULT_TIME_ZONE
+        )
+    )
 
-        def _day_cfg(day: int) -> tuple[bool, time, time] | None:
-            cfg = _cfg_for_day(day)
-            if cfg is None or not bool(cfg.get("enabled", False)):
-                return None
-            from_time = parse_time(cfg.get("from"), default=DEFAULT_WORKING_FROM)
-            to_time = parse_time(cfg.get("to"), default=DEFAULT_WORKING_TO)
-            return True, from_time, to_time
-
-        today = _day_cfg(weekday)
-        prev_day = _day_cfg(prev)
-        candidates: list[tuple[str, datetime]] = []
-        from_today = today[1] if today is not None else None
-
-        if today is not None:
-            _enabled, from_time, to_time = today
-            if not is_overnight(from_time, to_time) and start_clock >= to_time:
-                end_local = start_local.replace(
-                    hour=to_time.hour, minute=to_time.minute, second=0, microsecond=0
-                )
-                candidates.append(
-                    (f"{to_time.hour:02d}:{to_time.minute:02d}", dt_util.as_utc(end_local))
-                )
 
-        if prev_day is not None and from_today is not None:
-            _enabled, from_time, to_time = prev_day
-            if (
-                is_overnight(from_time, to_time)
-                and start_clock >= to_time
-                and start_clock < from_today
-            ):
-                end_local = start_local.replace(
-                    hour=to_time.hour, minute=to_time.minute, second=0, microsecond=0
-                )
-                candidates.append(
-                    (f"{to_time.hour:02d}:{to_time.minute:02d}", dt_util.as_utc(end_local))
-                )
+@dataclass(frozen=True, slots=True)
+class ScheduleDay:
+    """Enabled schedule day as minutes after local midnight."""
 
-        if not candidates:
-            return None
-        return max(candidates, key=lambda item: item[1])
+    start: int
+    end: int
+    overnight: bool
 
-    working_from_str = options.get(CONF_WORKING_FROM)
-    working_from = (
-        dt_util.parse_time(working_from_str) if isinstance(working_from_str, str) else None
-    )
-    working_to_str = options.get(CONF_WORKING_TO)
-    working_to = (
-        dt_util.parse_time(working_to_str) if isinstance(working_to_str, str) else None
-    )
-    if working_from is None or working_to is None:
-        return None
 
-    workdays = parse_workdays(options.get(CONF_WORKDAYS), default=DEFAULT_WORKDAYS)
-    if is_overnight(working_from, working_to):
-        if not (start_clock >= working_to and start_clock < working_from):
-            return None
-        if workdays and prev not in workdays:
-            return None
-    else:
-        if start_clock < working_to:
-            return None
-        if workdays and weekday not in workdays:
+@dataclass(frozen=True, slots=True)
+class CompiledSchedule:
+    """Auto-end schedule parsed once per options version.
+
+    `days` holds the enabled days (0=Mon..6=Sun; None when disabled).
+    `configured` tells whether the options contain a schedule at all rather than
+    the defaults, which is what the create-reservation guard relies on.
+    """
+
+    days: tuple[ScheduleDay | None, ...]
+    configured: bool
+
+    @classmethod
+    def from_options(
+        cls,
+        options: Mapping[str, Any],
+        *,
+        fallback_from: str | None = None,
+        fallback_to: str | None = None,
+    ) -> CompiledSchedule:
+        """Compile the schedule from the entry options."""
+        schedule = schedule_for_options(
+            options, fallback_from=fallback_from, fallback_to=fallback_to
+        )
+        configured = isinstance(options.get(CONF_SCHEDULE), Mapping) or all(
+            isinstance(value := options.get(key), str)
+            and dt_util.parse_time(value) is not None
+            for key in (CONF_WORKING_FROM, CONF_WORKING_TO)
+        )
+        return cls(
+            days=tuple(
+                ScheduleDay(
+                    start=_minutes(from_time),
+                    end=_minutes(to_time),
+                    overnight=is_overnight(from_time, to_time),
+                )
+                if enabled
+                else None
+                for enabled, from_time, to_time in (schedule[day] for day in range(7))
+            ),
+            configured=configured,
+        )
+
+    def is_working(self, moment: datetime) -> bool:
+        """Return whether moment falls inside a schedule period."""
+        local = dt_util.as_local(moment)
+        minute = local.hour * 60 + local.minute
+        today = self.days[local.weekday()]
+        prev_day = self.days[(local.weekday() - 1) % 7]
+        if today is not None and (
+            minute >= today.start if today.overnight else today.start <= minute < today.end
+        ):
+            return True
+        return prev_day is not None and prev_day.overnight and minute < prev_day.end
+
+    def scheduled_end_for_start(self, start_time: datetime) -> tuple[str, datetime] | None:
+        """Return (working_to_hhmm, scheduled_end_utc) when start_time is after the schedule end.
+
+        Only reservations starting between today's schedule end (or the end of
+        last night's overnight period) and the next schedule start qualify.
+        """
+        local = dt_util.as_local(start_time)
+        minute = local.hour * 60 + local.minute
+        today = self.days[local.weekday()]
+        prev_day = self.days[(local.weekday() - 1) % 7]
+
+        end: int | None = None
+        if today is not None and not today.overnight and minute >= today.end:
+            end = today.end
+        if (
+            prev_day is not None
+            and today is not None
+            and prev_day.overnight
+            and prev_day.end <= minute < today.start
+        ):
+            end = prev_day.end if end is None else max(end, prev_day.end)
+        if end is None:
             return None
-    end_local = start_local.replace(
-        hour=working_to.hour, minute=working_to.minute, second=0, microsecond=0
-    )
-    return (f"{working_to.hour:02d}:{working_to.minute:02d}", dt_util.as_utc(end_local))
+        return _hhmm(end), _at_minute(local.date(), end)
+
+    def _ends_on(self, day: date) -> list[datetime]:
+        """Return the schedule ends (UTC) falling on a local day, in order.
+
+        Those are the end of that day's own period and the end of an overnight
+        period that started the day before. Local times are converted per day,
+        so offsets follow DST transitions.
+        """
+        today = self.days[day.weekday()]
+        prev_day = self.days[(day.weekday() - 1) % 7]
+        minutes = {
+            schedule_day.end
+            for schedule_day, overnight in ((today, False), (prev_day, True))
+            if schedule_day is not None and schedule_day.overnight is overnight
+        }
+        return sorted(_at_minute(day, minute) for minute in minutes)
+
+    def iter_ends_after(self, moment: datetime) -> Iterator[datetime]:
+        """Lazily yield the schedule ends after moment, earliest first."""
+        if not any(self.days):
+            return
+        # Start a day early: a local day's ends can fall before its midnight in UTC.
+        day = dt_util.as_local(moment).date() - timedelta(days=1)
+        while True:
+            for end in self._ends_on(day):
+                if end > moment:
+                    yield end
+            day += timedelta(days=1)
+
+    def iter_ends_before(self, moment: datetime) -> Iterator[datetime]:
+        """Lazily yield the schedule ends at or before moment, latest first."""
+        if not any(self.days):
+            return
+        day = dt_util.as_local(moment).date() + timedelta(days=1)
+        while True:
+            for end in reversed(self._ends_on(day)):
+                if end <= moment:
+                    yield end
+            day -= timedelta(days=1)
@@ -15,7 +15,11 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util, slugify
 
 from .const import DOMAIN
-from .coordinator import TheHagueParkingCoordinator, TheHagueParkingData
+from .coordinator import (
+    TheHagueParkingCoordinator,
+    TheHagueParkingData,
+    TheHagueParkingResource,
+)
 
 PARALLEL_UPDATES = 0
 
@@ -29,77 +33,26 @@ class TheHagueParkingSensorEntityDescription(SensorEntityDescription):
     translation_key: str | None = None
 
 
-def _parse_dt(value: str | None) -> datetime | None:
-    if value is None:
-        return None
-    return dt_util.parse_datetime(value)
-
-
-def _format_minutes(value: Any) -> str | None:
+def _format_minutes(value: int | None) -> str | None:
     if value is None:
         return None
-    try:
-        total_minutes = int(value)
-    except (TypeError, ValueError):
-        return None
 
-    sign = "-" if total_minutes < 0 else ""
-    hours, minutes = divmod(abs(total_minutes), 60)
+    sign = "-" if value < 0 else ""
+    hours, minutes = divmod(abs(value), 60)
     return f"{sign}{hours}:{minutes:02d}"
 
 
-def _format_time(value: str | None) -> str | None:
-    parsed = _parse_dt(value)
-    if parsed is None:
+def _format_time(value: datetime | None) -> str | None:
+    if value is None:
         return None
-    if parsed.tzinfo is None:
-        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
-    return dt_util.as_local(parsed).strftime("%H:%M")
-
-
-def _clean_favorite(favorite: dict[str, Any]) -> dict[str, str | int | None]:
-    favorite_id = favorite.get("id")
-    favorite_id_clean: int | None = None
-    if isinstance(favorite_id, int):
-        favorite_id_clean = favorite_id
-    elif isinstance(favorite_id, str) and favorite_id.isdigit():
-        favorite_id_clean = int(favorite_id)
-
-    name = favorite.get("name")
-    license_plate = favorite.get("license_plate")
-    return {
-        "id": favorite_id_clean,
-        "name": name if isinstance(name, str) else None,
-        "license_plate": license_plate if isinstance(license_plate, str) else None,
-    }
-
-
-def _clean_reservation(reservation: dict[str, Any]) -> dict[str, str | int | None]:
-    reservation_id = reservation.get("id")
-    reservation_id_clean: int | None = None
-    if isinstance(reservation_id, int):
-        reservation_id_clean = reservation_id
-    elif isinstance(reservation_id, str) and reservation_id.isdigit():
-        reservation_id_clean = int(reservation_id)
-
-    name = reservation.get("name")
-    license_plate = reservation.get("license_plate")
-    start_time = reservation.get("start_time")
-    end_time = reservation.get("end_time")
-    return {
-        "id": reservation_id_clean,
-        "name": name if isinstance(name, str) else None,
-        "license_plate": license_plate if isinstance(license_plate, str) else None,
-        "start_time": start_time if isinstance(start_time, str) else None,
-        "end_time": end_time if isinstance(end_time, str) else None,
-    }
+    return dt_util.as_local(value).strftime("%H:%M")
 
 
 SENSORS: tuple[TheHagueParkingSensorEntityDescription, ...] = (
     TheHagueParkingSensorEntityDescription(
         key="account",
         translation_key="account",
-        value_fn=lambda data: _format_minutes(data.account.get("debit_minutes")),
+        value_fn=lambda data: _format_minutes(data.account.debit_minutes),
     ),
     TheHagueParkingSensorEntityDescription(
         key="reservations",
@@ -167,7 +120,7 @@ class TheHagueParkingSensor(CoordinatorEntity[TheHagueParkingCoordinator], Senso
         description: TheHagueParkingSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=TheHagueParkingResource(description.key))
         self.entity_description: TheHagueParkingSensorEntityDescription = description
 
         unique_base = entry.unique_id or entry.entry_id
@@ -186,33 +139,34 @@ class TheHagueParkingSensor(CoordinatorEntity[TheHagueParkingCoordinator], Senso
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
+        data = self.coordinator.data
+        attributes: dict[str, Any] = {}
         if self.entity_description.key == "account":
-            raw_zone = self.coordinator.data.account.get("zone")
-            zone = raw_zone if isinstance(raw_zone, dict) else {}
-            return {
-                "debit_minutes": _format_minutes(
-                    self.coordinator.data.account.get("debit_minutes")
-                ),
-                "zone": zone.get("name") if zone else None,
-                "zone_start_time": _format_time(zone.get("start_time")) if zone else None,
-                "zone_end_time": _format_time(zone.get("end_time")) if zone else None,
+            account = data.account
+            zone = account.zone
+            attributes = {
+                "debit_minutes": _format_minutes(account.debit_minutes),
+                "zone": zone.name if zone else None,
+                "zone_start_time": _format_time(zone.start_time) if zone else None,
+                "zone_end_time": _format_time(zone.end_time) if zone else None,
             }
 
-        if self.entity_description.key == "reservations":
-            return {
+        elif self.entity_description.key == "reservations":
+            attributes = {
                 "reservations": [
-                    _clean_reservation(reservation)
-                    for reservation in self.coordinator.data.reservations
-                    if isinstance(reservation, dict)
+                    reservation.as_dict() for reservation in data.reservations
                 ],
             }
 
-        if self.entity_description.key == "favorites":
-            return {
-                "favorites": [
-                    _clean_favorite(favorite)
-                    for favorite in self.coordinator.data.favorites
-                ],
+        elif self.entity_description.key == "favorites":
+            attributes = {
+                "favorites": [favorite.as_dict() for favorite in data.favorites],
             }
 
-        return {}
+        if data.stale:
+            attributes["stale"] = True
+            if (updated := self.coordinator.data_updated) is not None:
+                attributes["data_age"] = int(
+                    (dt_util.utcnow() - updated).total_seconds() // 60
+                )
+        return attributes
@@ -1,6 +1,7 @@
 """Service handlers for Den Haag parking."""
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from functools import partial
 import logging
@@ -18,10 +19,12 @@ from .api import (
     TheHagueParkingAuthError,
     TheHagueParkingConnectionError,
     TheHagueParkingError,
+    TheHagueParkingFavorite,
     TheHagueParkingResponseError,
+    format_datetime,
 )
 from .const import (
-    CONF_AUTO_END_ENABLED,
+    CONF_END_AT_SCHEDULE,
     DOMAIN,
     SERVICE_ADJUST_RESERVATION_END_TIME,
     SERVICE_CREATE_FAVORITE,
@@ -30,7 +33,7 @@ from .const import (
     SERVICE_DELETE_FAVORITE,
     SERVICE_UPDATE_FAVORITE,
 )
-from .schedule import scheduled_end_for_start
+from .coordinator import TheHagueParkingResource
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,7 +52,7 @@ SERVICE_CREATE_SCHEMA = vol.Schema(
 SERVICE_DELETE_SCHEMA = vol.Schema(
     {
         vol.Optional("config_entry_id"): cv.string,
-        vol.Required("reservation_id"): cv.positive_int,
+        vol.Required("reservation_id"): vol.All(cv.ensure_list, [cv.positive_int]),
     }
 )
 
@@ -176,33 +179,23 @@ def _hhmm(value: datetime) -> str:
     return f"{local.hour:02d}:{local.minute:02d}"
 
 
-def _find_reservation(
-    reservations: list[dict[str, Any]], reservation_id: int
-) -> dict[str, Any] | None:
-    for reservation in reservations:
-        if reservation.get("id") == reservation_id:
-            return reservation
-        if str(reservation.get("id")) == str(reservation_id):
-            return reservation
-    return None
-
-
-def _reservation_id(value: object) -> int | None:
-    """Parse a reservation id to int."""
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str) and value.isdigit():
-        return int(value)
-    return None
+async def _async_zone_end(runtime_data: Any, moment: datetime) -> datetime | None:
+    """Return the zone end time for a moment, preferring the weekly table."""
+    if (zone_hours := runtime_data.zone_hours) is not None and (
+        zone_end := zone_hours.end_for(moment)
+    ) is not None:
+        return zone_end
+    zone = await runtime_data.coordinator.client.async_fetch_end_time(
+        int(moment.timestamp())
+    )
+    return zone.end_time
 
 
 async def _async_create_reservation(hass: HomeAssistant, call: ServiceCall) -> None:
-    entry_id, runtime_data = _get_runtime_data(hass, call)
+    _entry_id, runtime_data = _get_runtime_data(hass, call)
 
     coordinator = runtime_data.coordinator
     client = coordinator.client
-    entry = hass.config_entries.async_get_entry(entry_id)
-    options = entry.options if entry else {}
 
     license_plate = _normalize_license_plate(call.data["license_plate"])
     if not license_plate:
@@ -227,21 +220,17 @@ async def _async_create_reservation(hass: HomeAssistant, call: ServiceCall) -> N
 
     # If a reservation is created between the configured working end time and the
     # zone end time, do not create it (it would be auto-ended shortly after).
-    if bool(options.get(CONF_AUTO_END_ENABLED, True)) and (
-        schedule_end := scheduled_end_for_start(start_time, options)
+    if (
+        (schedule := coordinator.schedule) is not None
+        and schedule.configured
+        and (schedule_end := schedule.scheduled_end_for_start(start_time))
     ):
         working_to_hhmm, working_to_utc = schedule_end
         try:
-            zone = await client.async_fetch_end_time(int(start_time.timestamp()))
+            zone_end = await _async_zone_end(runtime_data, start_time)
         except TheHagueParkingError:
-            zone = None
+            zone_end = None
 
-        zone_end_str = zone.get("end_time") if zone else None
-        zone_end = (
-            _parse_required_dt(zone_end_str, "zone_end_time")
-            if isinstance(zone_end_str, str)
-            else None
-        )
         if (
             zone_end is not None
             and working_to_utc < zone_end
@@ -266,19 +255,27 @@ async def _async_create_reservation(hass: HomeAssistant, call: ServiceCall) -> N
     )
     if end_time is None:
         try:
-            zone = await client.async_fetch_end_time(int(start_time.timestamp()))
+            end_time = await _async_zone_end(runtime_data, start_time)
         except TheHagueParkingError as err:
             _LOGGER.debug("Could not determine zone end time", exc_info=err)
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="could_not_determine_zone_end_time",
             ) from err
-        if not (end_time_str := zone.get("end_time")):
+        if end_time is None:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="could_not_determine_zone_end_time",
             )
-        end_time = _parse_required_dt(end_time_str, "end_time")
+
+    # Let the backend end the reservation at the schedule end.
+    if (
+        coordinator.config_entry.options.get(CONF_END_AT_SCHEDULE, False)
+        and (schedule := coordinator.schedule) is not None
+        and (schedule_end := next(schedule.iter_ends_after(start_time), None))
+        and schedule_end < end_time
+    ):
+        end_time = schedule_end
 
     if end_time <= start_time:
         raise ServiceValidationError(
@@ -290,8 +287,8 @@ async def _async_create_reservation(hass: HomeAssistant, call: ServiceCall) -> N
         reservation = await client.async_create_reservation(
             license_plate=license_plate,
             name=name,
-            start_time=start_time.isoformat().replace("+00:00", "Z"),
-            end_time=end_time.isoformat().replace("+00:00", "Z"),
+            start_time=format_datetime(start_time),
+            end_time=format_datetime(end_time),
         )
     except TheHagueParkingError as err:
         _LOGGER.debug("Could not create reservation", exc_info=err)
@@ -301,14 +298,18 @@ async def _async_create_reservation(hass: HomeAssistant, call: ServiceCall) -> N
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    if isinstance(reservation, dict) and (reservation_id := _reservation_id(reservation.get("id"))):
-        async with runtime_data.created_reservations_lock:
-            runtime_data.created_reservation_ids.add(reservation_id)
-            await runtime_data.created_reservations_store.async_save(
-                runtime_data.created_reservation_ids
-            )
+    if reservation is None:
+        await coordinator.async_refresh_after_change(
+            TheHagueParkingResource.RESERVATIONS, TheHagueParkingResource.ACCOUNT
+        )
+        return
 
-    await coordinator.async_request_refresh()
+    async with runtime_data.created_reservations_lock:
+        runtime_data.created_reservation_ids.add(reservation.id)
+        await runtime_data.created_reservations_store.async_save(
+            runtime_data.created_reservation_ids
+        )
+    coordinator.async_upsert_reservation(reservation)
 
 
 async def _async_delete_reservation(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -317,8 +318,9 @@ async def _async_delete_reservation(hass: HomeAssistant, call: ServiceCall) -> N
     coordinator = runtime_data.coordinator
     client = coordinator.client
 
+    reservation_ids: list[int] = list(dict.fromkeys(call.data["reservation_id"]))
     try:
-        await client.async_delete_reservation(call.data["reservation_id"])
+        results = await client.async_delete_reservations(reservation_ids)
     except TheHagueParkingError as err:
         _LOGGER.debug("Could not delete reservation", exc_info=err)
         raise HomeAssistantError(
@@ -327,15 +329,24 @@ async def _async_delete_reservation(hass: HomeAssistant, call: ServiceCall) -> N
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    reservation_id = call.data["reservation_id"]
+    deleted_ids = {result.item for result in results if result.ok}
     async with runtime_data.created_reservations_lock:
-        if reservation_id in runtime_data.created_reservation_ids:
-            runtime_data.created_reservation_ids.remove(reservation_id)
+        if deleted_ids & runtime_data.created_reservation_ids:
+            runtime_data.created_reservation_ids.difference_update(deleted_ids)
             await runtime_data.created_reservations_store.async_save(
                 runtime_data.created_reservation_ids
             )
 
-    await coordinator.async_request_refresh()
+    if deleted_ids:
+        coordinator.async_remove_reservations(deleted_ids)
+
+    if errors := [result.error for result in results if result.error is not None]:
+        _LOGGER.debug("Could not delete reservation", exc_info=errors[0])
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="could_not_delete_reservation",
+            translation_placeholders={"error": _error_for_user(errors[0])},
+        ) from errors[0]
 
 
 async def _async_adjust_reservation_end_time(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -347,11 +358,16 @@ async def _async_adjust_reservation_end_time(hass: HomeAssistant, call: ServiceC
     reservation_id: int = call.data["reservation_id"]
     end_time = _parse_required_dt(call.data["end_time"], "end_time")
 
-    reservation = _find_reservation(coordinator.data.reservations, reservation_id)
+    reservation = coordinator.data.reservations_by_id.get(reservation_id)
     if reservation is None:
         try:
-            reservation = _find_reservation(
-                await client.async_fetch_reservations(), reservation_id
+            reservation = next(
+                (
+                    item
+                    for item in await client.async_fetch_reservations()
+                    if item.id == reservation_id
+                ),
+                None,
             )
         except TheHagueParkingError:
             reservation = None
@@ -362,16 +378,11 @@ async def _async_adjust_reservation_end_time(hass: HomeAssistant, call: ServiceC
             translation_key="reservation_not_available",
         )
 
-    start_time_raw = reservation.get("start_time")
-    start_time = (
-        dt_util.parse_datetime(start_time_raw) if isinstance(start_time_raw, str) else None
-    )
-    if start_time is None:
+    if (start_utc := reservation.start_time) is None:
         raise HomeAssistantError(
             translation_domain=DOMAIN,
             translation_key="reservation_start_time_not_available",
         )
-    start_utc = _as_utc(start_time)
 
     if end_time <= start_utc:
         raise ServiceValidationError(
@@ -380,32 +391,27 @@ async def _async_adjust_reservation_end_time(hass: HomeAssistant, call: ServiceC
         )
 
     try:
-        zone = await client.async_fetch_end_time(int(start_utc.timestamp()))
+        zone_end = await _async_zone_end(runtime_data, start_utc)
     except TheHagueParkingError:
-        zone = None
+        zone_end = None
 
-    zone_end_str = zone.get("end_time") if zone else None
-    if isinstance(zone_end_str, str):
-        zone_end = dt_util.parse_datetime(zone_end_str)
-        if zone_end is not None and end_time >= _as_utc(zone_end):
-            raise ServiceValidationError(
-                translation_domain=DOMAIN,
-                translation_key="end_time_must_be_before_zone_end_time",
-            )
+    if zone_end is not None and end_time >= zone_end:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="end_time_must_be_before_zone_end_time",
+        )
 
-    current_end_raw = reservation.get("end_time")
-    current_end = dt_util.parse_datetime(current_end_raw) if isinstance(current_end_raw, str) else None
+    current_end = reservation.end_time
     if (
         current_end is not None
-        and _as_utc(current_end).replace(microsecond=0)
-        == end_time.replace(microsecond=0)
+        and current_end.replace(microsecond=0) == end_time.replace(microsecond=0)
     ):
         return
 
     try:
-        await client.async_patch_reservation_end_time(
+        updated = await client.async_patch_reservation_end_time(
             reservation_id=reservation_id,
-            end_time=end_time.isoformat().replace("+00:00", "Z"),
+            end_time=format_datetime(end_time),
         )
     except TheHagueParkingError as err:
         _LOGGER.debug("Could not adjust reservation", exc_info=err)
@@ -415,7 +421,9 @@ async def _async_adjust_reservation_end_time(hass: HomeAssistant, call: ServiceC
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    await coordinator.async_request_refresh()
+    coordinator.async_upsert_reservation(
+        updated or replace(reservation, end_time=end_time.replace(microsecond=0))
+    )
 
 
 async def _async_create_favorite(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -439,7 +447,7 @@ async def _async_create_favorite(hass: HomeAssistant, call: ServiceCall) -> None
     client = coordinator.client
 
     try:
-        await client.async_create_favorite(
+        favorite = await client.async_create_favorite(
             license_plate=license_plate,
             name=name,
         )
@@ -451,7 +459,10 @@ async def _async_create_favorite(hass: HomeAssistant, call: ServiceCall) -> None
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    await coordinator.async_request_refresh()
+    if favorite is None:
+        await coordinator.async_refresh_after_change(TheHagueParkingResource.FAVORITES)
+    else:
+        coordinator.async_upsert_favorite(favorite)
 
 
 async def _async_delete_favorite(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -470,7 +481,7 @@ async def _async_delete_favorite(hass: HomeAssistant, call: ServiceCall) -> None
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    await coordinator.async_request_refresh()
+    coordinator.async_remove_favorite(call.data["favorite_id"])
 
 
 async def _async_update_favorite(hass: HomeAssistant, call: ServiceCall) -> None:
@@ -494,7 +505,7 @@ async def _async_update_favorite(hass: HomeAssistant, call: ServiceCall) -> None
     client = coordinator.client
 
     try:
-        await client.async_update_favorite(
+        favorite = await client.async_update_favorite(
             favorite_id=call.data["favorite_id"],
             license_plate=license_plate,
             name=name,
@@ -507,7 +518,12 @@ async def _async_update_favorite(hass: HomeAssistant, call: ServiceCall) -> None
             translation_placeholders={"error": _error_for_user(err)},
         ) from err
 
-    await coordinator.async_request_refresh()
+    coordinator.async_upsert_favorite(
+        favorite
+        or TheHagueParkingFavorite(
+            id=call.data["favorite_id"], name=name, license_plate=license_plate
+        )
+    )
 
 
 async def async_register_services(hass: HomeAssistant) -> None:
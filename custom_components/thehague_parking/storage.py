@@ -3,16 +3,25 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Iterable
-from typing import Final
+from collections.abc import Callable, Iterable
+from datetime import datetime
+from typing import Any, Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .coordinator import TheHagueParkingData
+from .zone_hours import ZoneHours
 
 _STORAGE_VERSION: Final = 1
 _STORAGE_KEY: Final = f"{DOMAIN}.created_reservations"
+_SESSION_STORAGE_KEY: Final = f"{DOMAIN}.session"
+_SESSION_SAVE_DELAY: Final = 1
+_ZONE_HOURS_STORAGE_KEY: Final = f"{DOMAIN}.zone_hours"
+_SNAPSHOT_STORAGE_KEY: Final = f"{DOMAIN}.snapshot"
+_SNAPSHOT_SAVE_DELAY: Final = 10
 
 
 class CreatedReservationsStore:
@@ -48,3 +57,89 @@ class CreatedReservationsStore:
                 }
             )
             await self._store.async_save({"reservation_ids": ids})
+
+    async def async_remove(self) -> None:
+        """Remove the stored reservation ids."""
+        async with self._lock:
+            await self._store.async_remove()
+
+
+class SessionStore:
+    """Persist the authenticated API session of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, _STORAGE_VERSION, f"{_SESSION_STORAGE_KEY}.{entry_id}", private=True
+        )
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored session."""
+        data = await self._store.async_load()
+        return data if isinstance(data, dict) else None
+
+    @callback
+    def async_delay_save(self, data_func: Callable[[], dict[str, Any] | None]) -> None:
+        """Save the session shortly, coalescing rapid successive logins."""
+        self._store.async_delay_save(lambda: data_func() or {}, _SESSION_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the stored session."""
+        await self._store.async_remove()
+
+
+class ZoneHoursStore:
+    """Persist the weekly zone hours table of a config entry."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, _STORAGE_VERSION, f"{_ZONE_HOURS_STORAGE_KEY}.{entry_id}"
+        )
+
+    async def async_load(self) -> ZoneHours | None:
+        """Load the zone hours table."""
+        if not isinstance(data := await self._store.async_load(), dict):
+            return None
+        return ZoneHours.from_dict(data)
+
+    async def async_save(self, zone_hours: ZoneHours) -> None:
+        """Save the zone hours table."""
+        await self._store.async_save(zone_hours.as_dict())
+
+    async def async_remove(self) -> None:
+        """Remove the zone hours table."""
+        await self._store.async_remove()
+
+
+class SnapshotStore:
+    """Persist the last data confirmed by the API."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, _STORAGE_VERSION, f"{_SNAPSHOT_STORAGE_KEY}.{entry_id}"
+        )
+
+    async def async_load(self) -> tuple[TheHagueParkingData, datetime] | None:
+        """Load the snapshot and when it was confirmed."""
+        if not isinstance(data := await self._store.async_load(), dict):
+            return None
+        raw_updated = data.get("updated")
+        if not isinstance(raw_updated, str) or not (
+            updated := dt_util.parse_datetime(raw_updated)
+        ):
+            return None
+        return TheHagueParkingData.from_dict(data), dt_util.as_utc(updated)
+
+    @callback
+    def async_delay_save(self, data: TheHagueParkingData, updated: datetime) -> None:
+        """Save the snapshot shortly, coalescing successive updates."""
+        self._store.async_delay_save(
+            lambda: {"updated": updated.isoformat(), **data.as_dict()},
+            _SNAPSHOT_SAVE_DELAY,
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the snapshot."""
+        await self._store.async_remove()
@@ -0,0 +1,123 @@
+"""Weekly zone hours for Den Haag parking."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+import logging
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .api import TheHagueParkingClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rebuild the table when it is older than this.
+ZONE_HOURS_MAX_AGE = timedelta(days=1)
+
+
+def _hhmm(value: time) -> str:
+    return f"{value.hour:02d}:{value.minute:02d}"
+
+
+@dataclass(frozen=True, slots=True)
+class ZoneHours:
+    """Local zone start/end time per weekday (0=Mon..6=Sun)."""
+
+    days: tuple[tuple[time, time] | None, ...]
+    updated: datetime
+
+    @property
+    def stale(self) -> bool:
+        """Return whether the table should be rebuilt."""
+        return dt_util.utcnow() - self.updated >= ZONE_HOURS_MAX_AGE
+
+    def hhmm(self, weekday: int) -> tuple[str | None, str | None]:
+        """Return the zone start/end time of a weekday as HH:MM."""
+        if (hours := self.days[weekday]) is None:
+            return None, None
+        return _hhmm(hours[0]), _hhmm(hours[1])
+
+    def end_for(self, moment: datetime) -> datetime | None:
+        """Return the zone end time (UTC) for a moment before that day's zone end.
+
+        Returns None when the weekday is unknown or the moment is at or after the
+        zone end, in which case the API has to be asked.
+        """
+        local = dt_util.as_local(moment)
+        if (hours := self.days[local.weekday()]) is None:
+            return None
+        start, end = hours
+        if end <= start:
+            return None
+        end_local = local.replace(
+            hour=end.hour, minute=end.minute, second=0, microsecond=0
+        )
+        if local >= end_local:
+            return None
+        return dt_util.as_utc(end_local)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serializable representation."""
+        return {
+            "days": [
+                [_hhmm(hours[0]), _hhmm(hours[1])] if hours else None
+                for hours in self.days
+            ],
+            "updated": self.updated.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ZoneHours | None:
+        """Restore a table from its stored representation."""
+        raw_days = data.get("days")
+        raw_updated = data.get("updated")
+        if not isinstance(raw_days, list) or len(raw_days) != 7:
+            return None
+        if not isinstance(raw_updated, str) or not (
+            updated := dt_util.parse_datetime(raw_updated)
+        ):
+            return None
+
+        days: list[tuple[time, time] | None] = []
+        for raw_day in raw_days:
+            if (
+                isinstance(raw_day, list)
+                and len(raw_day) == 2
+                and all(isinstance(value, str) for value in raw_day)
+                and (start := dt_util.parse_time(raw_day[0])) is not None
+                and (end := dt_util.parse_time(raw_day[1])) is not None
+            ):
+                days.append((start, end))
+            else:
+                days.append(None)
+        return cls(days=tuple(days), updated=dt_util.as_utc(updated))
+
+
+async def async_build_zone_hours(
+    client: TheHagueParkingClient, now: datetime
+) -> ZoneHours:
+    """Look up the zone hours of the coming 7 days."""
+    days: list[tuple[time, time] | None] = [None] * 7
+    today = dt_util.as_local(now).date()
+    for offset in range(7):
+        day = today + timedelta(days=offset)
+        # Ask for local noon, which lies inside the paid-parking window of every
+        # zone; the reply only counts when it describes that same day.
+        noon = datetime.combine(day, time(12), tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        zone = await client.async_fetch_end_time(int(noon.timestamp()))
+        if zone.start_time is None or zone.end_time is None:
+            continue
+        start_local = dt_util.as_local(zone.start_time)
+        end_local = dt_util.as_local(zone.end_time)
+        if start_local.date() != day:
+            continue
+        days[day.weekday()] = (
+            start_local.time().replace(second=0, microsecond=0),
+            end_local.time().replace(second=0, microsecond=0),
+        )
+
+    _LOGGER.debug("Built zone hours table: %s", days)
+    return ZoneHours(days=tuple(days), updated=dt_util.as_utc(now))
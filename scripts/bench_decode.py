@@ -0,0 +1,85 @@
+"""Benchmark the JSON decode path of the API client.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python scripts/bench_decode.py
+
+The client used to decode with `response.json(content_type=None)`. That path
+decodes the body to text and parses it with the stdlib `json` module. It now
+passes the raw bytes to Home Assistant's `json_loads` (orjson). Both paths
+are timed on reservation and favorite payloads shaped like the API's.
+"""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import json
+import timeit
+from typing import Any
+
+from homeassistant.util.json import json_loads
+
+NUMBER = 2000
+
+
+def old_decode(raw: bytes) -> Any:
+    """Decode like `ClientResponse.json(content_type=None)` does."""
+    if not raw.strip():
+        return None
+    return json.loads(raw.decode("utf-8"))
+
+
+def new_decode(raw: bytes) -> Any:
+    """Decode like `TheHagueParkingClient._request_json_once` does."""
+    return json_loads(raw) if raw.strip() else None
+
+
+def _reservations(count: int) -> list[dict[str, Any]]:
+    start = datetime(2026, 10, 16, 8, tzinfo=UTC)
+    return [
+        {
+            "id": 1_200_000 + index,
+            "name": f"Visitor {index}",
+            "license_plate": f"{index % 100:02d}-ABC-{index % 10}",
+            "start_time": (start + timedelta(hours=index)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z"
+            ),
+            "end_time": (start + timedelta(hours=index + 2)).strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z"
+            ),
+        }
+        for index in range(count)
+    ]
+
+
+def _favorites(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": 300_000 + index,
+            "name": f"Favorite {index}",
+            "license_plate": f"{index % 100:02d}-XYZ-{index % 10}",
+        }
+        for index in range(count)
+    ]
+
+
+def main() -> None:
+    """Check both decoders and print the timings."""
+    payloads = {
+        "reservations (5)": _reservations(5),
+        "reservations (50)": _reservations(50),
+        "favorites (100)": _favorites(100),
+    }
+    for name, payload in payloads.items():
+        raw = json.dumps(payload).encode()
+        assert old_decode(raw) == new_decode(raw) == payload
+        old = timeit.timeit(lambda: old_decode(raw), number=NUMBER) / NUMBER
+        new = timeit.timeit(lambda: new_decode(raw), number=NUMBER) / NUMBER
+        print(
+            f"{name:<18} {len(raw):>6} bytes"
+            f"  old {old * 1e6:8.2f} us  new {new * 1e6:8.2f} us"
+            f"  ({old / new:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
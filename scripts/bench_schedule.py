@@ -0,0 +1,218 @@
+"""Benchmark the compiled schedule against the per-call option parsing it replaced.
+
+Run from the repository root in an environment with Home Assistant installed:
+
+    python scripts/bench_schedule.py
+
+The previous implementations are copied below so the comparison keeps working
+now that they are gone from the integration. Both sides are first checked to
+give the same answers on random schedules.
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import UTC, datetime, time, timedelta
+from pathlib import Path
+import random
+import sys
+import timeit
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.thehague_parking.const import (  # noqa: E402
+    CONF_SCHEDULE,
+    CONF_WORKDAYS,
+    CONF_WORKING_FROM,
+    CONF_WORKING_TO,
+    DEFAULT_WORKDAYS,
+    DEFAULT_WORKING_FROM,
+    DEFAULT_WORKING_TO,
+)
+from custom_components.thehague_parking.schedule import (  # noqa: E402
+    CompiledSchedule,
+    is_overnight,
+    parse_time,
+    parse_workdays,
+    schedule_for_options,
+)
+
+NUMBER = 20000
+
+
+def old_scheduled_end_for_start(
+    start_time: datetime, options: Mapping[str, Any]
+) -> tuple[str, datetime] | None:
+    """Previous `scheduled_end_for_start`, parsing the options on every call."""
+    start_local = dt_util.as_local(start_time)
+    weekday = start_local.weekday()
+    prev = (weekday - 1) % 7
+    start_clock = start_local.time().replace(second=0, microsecond=0)
+
+    schedule_opt = options.get(CONF_SCHEDULE)
+    if isinstance(schedule_opt, Mapping):
+
+        def _cfg_for_day(day: int) -> Mapping[str, Any] | None:
+            cfg = schedule_opt.get(day)
+            if cfg is None:
+                cfg = schedule_opt.get(str(day))
+            return cfg if isinstance(cfg, Mapping) else None
+
+        def _day_cfg(day: int) -> tuple[bool, time, time] | None:
+            cfg = _cfg_for_day(day)
+            if cfg is None or not bool(cfg.get("enabled", False)):
+                return None
+            from_time = parse_time(cfg.get("from"), default=DEFAULT_WORKING_FROM)
+            to_time = parse_time(cfg.get("to"), default=DEFAULT_WORKING_TO)
+            return True, from_time, to_time
+
+        today = _day_cfg(weekday)
+        prev_day = _day_cfg(prev)
+        candidates: list[tuple[str, datetime]] = []
+        from_today = today[1] if today is not None else None
+
+        if today is not None:
+            _enabled, from_time, to_time = today
+            if not is_overnight(from_time, to_time) and start_clock >= to_time:
+                end_local = start_local.replace(
+                    hour=to_time.hour, minute=to_time.minute, second=0, microsecond=0
+                )
+                candidates.append(
+                    (f"{to_time.hour:02d}:{to_time.minute:02d}", dt_util.as_utc(end_local))
+                )
+
+        if prev_day is not None and from_today is not None:
+            _enabled, from_time, to_time = prev_day
+            if (
+                is_overnight(from_time, to_time)
+                and start_clock >= to_time
+                and start_clock < from_today
+            ):
+                end_local = start_local.replace(
+                    hour=to_time.hour, minute=to_time.minute, second=0, microsecond=0
+                )
+                candidates.append(
+                    (f"{to_time.hour:02d}:{to_time.minute:02d}", dt_util.as_utc(end_local))
+                )
+
+        if not candidates:
+            return None
+        return max(candidates, key=lambda item: item[1])
+
+    working_from_str = options.get(CONF_WORKING_FROM)
+    working_from = (
+        dt_util.parse_time(working_from_str) if isinstance(working_from_str, str) else None
+    )
+    working_to_str = options.get(CONF_WORKING_TO)
+    working_to = (
+        dt_util.parse_time(working_to_str) if isinstance(working_to_str, str) else None
+    )
+    if working_from is None or working_to is None:
+        return None
+
+    workdays = parse_workdays(options.get(CONF_WORKDAYS), default=DEFAULT_WORKDAYS)
+    if is_overnight(working_from, working_to):
+        if not (start_clock >= working_to and start_clock < working_from):
+            return None
+        if workdays and prev not in workdays:
+            return None
+    else:
+        if start_clock < working_to:
+            return None
+        if workdays and weekday not in workdays:
+            return None
+    end_local = start_local.replace(
+        hour=working_to.hour, minute=working_to.minute, second=0, microsecond=0
+    )
+    return (f"{working_to.hour:02d}:{working_to.minute:02d}", dt_util.as_utc(end_local))
+
+
+def old_next_scheduled_end_utc(
+    now: datetime, schedule: Mapping[int, tuple[bool, time, time]]
+) -> datetime | None:
+    """Previous `next_scheduled_end_utc`, used by every auto-end sync."""
+    now_local = dt_util.as_local(now)
+    candidates: list[datetime] = []
+    for days_back in range(-7, 2):
+        day_date = now_local.date() - timedelta(days=days_back)
+        enabled, from_time, to_time = schedule[day_date.weekday()]
+        if not enabled:
+            continue
+
+        end_date = day_date + timedelta(days=1) if is_overnight(from_time, to_time) else day_date
+        end_utc = dt_util.as_utc(
+            datetime.combine(end_date, to_time, tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        )
+        if end_utc > now:
+            candidates.append(end_utc)
+
+    return min(candidates) if candidates else None
+
+
+def _random_options(rng: random.Random) -> dict[str, Any]:
+    def _clock() -> str:
+        return f"{rng.randrange(24):02d}:{rng.choice((0, 15, 30, 45)):02d}"
+
+    return {
+        CONF_SCHEDULE: {
+            str(day): {"enabled": True, "from": _clock(), "to": _clock()}
+            if rng.random() < 0.7
+            else {"enabled": False}
+            for day in range(7)
+        }
+    }
+
+
+def check(trials: int = 300, moments: int = 200) -> None:
+    """Fail when the compiled schedule disagrees with the old functions."""
+    rng = random.Random(1)
+    base = datetime(2026, 3, 20, tzinfo=UTC)
+    for _ in range(trials):
+        options = _random_options(rng)
+        compiled = CompiledSchedule.from_options(options)
+        legacy = schedule_for_options(options)
+        for _ in range(moments):
+            moment = base + timedelta(minutes=rng.randrange(60 * 24 * 20))
+            assert old_scheduled_end_for_start(
+                moment, options
+            ) == compiled.scheduled_end_for_start(moment), (options, moment)
+            assert old_next_scheduled_end_utc(moment, legacy) == next(
+                compiled.iter_ends_after(moment), None
+            ), (options, moment)
+
+
+def main() -> None:
+    """Check both implementations and print the timings."""
+    check()
+
+    options = {
+        CONF_SCHEDULE: {
+            str(day): {"enabled": day < 5, "from": "08:00", "to": "17:30"}
+            for day in range(7)
+        }
+    }
+    compiled = CompiledSchedule.from_options(options)
+    moment = datetime(2026, 10, 16, 16, tzinfo=UTC)
+
+    timings = {
+        "scheduled_end_for_start (old)": lambda: old_scheduled_end_for_start(
+            moment, options
+        ),
+        "scheduled_end_for_start (compiled)": lambda: compiled.scheduled_end_for_start(
+            moment
+        ),
+        "next end after (old)": lambda: old_next_scheduled_end_utc(
+            moment, schedule_for_options(options)
+        ),
+        "next end after (compiled)": lambda: next(compiled.iter_ends_after(moment)),
+        "compile": lambda: CompiledSchedule.from_options(options),
+    }
+    for name, func in timings.items():
+        seconds = timeit.timeit(func, number=NUMBER)
+        print(f"{name:<36} {seconds / NUMBER * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()